@@ -0,0 +1,53 @@
+from benchmarks.reports import best_of, rows, table_report
+from src.templates import AnaliseCredito
+
+import argparse
+import os
+
+
+"""
+Build time of single pass builds, against the two passes builds used to take.
+
+The page total of the header was found by laying out and rendering the whole
+report into a throwaway buffer, then building it again with the total known.
+Builds now take a single pass and fill the total in at the end. The two passes
+are timed as a throwaway build followed by the real one, the same work the
+previous build did.
+
+    python -m benchmarks.build_time [--rows 5000] [--repeat 5]
+"""
+
+
+def two_passes(build):
+    build()
+    build()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build time, single pass")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    reports = [
+        ("RelatorioPositivo", lambda: AnaliseCredito.PJ.RelatorioPositivo(os.devnull)),
+        (
+            "Table, %d rows" % args.rows,
+            lambda: table_report(list(rows(args.rows))).build_bytes(),
+        ),
+    ]
+
+    for name, build in reports:
+        # Fonts, icons and caches are loaded before timing
+        build()
+
+        single = best_of(args.repeat, build)
+        double = best_of(args.repeat, two_passes, build)
+        print(
+            "%-20s single pass %8.1f ms   two passes %8.1f ms   %.2fx faster"
+            % (name, single * 1000, double * 1000, double / single)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from src.components.header import HeaderData
+from src.components.table import Table
+from src.pdf_builder import PDFBuilder
+from src.types.components import TableData
+from src.types.misc import DictKey
+
+from typing import Iterable, Iterator
+
+import time
+
+
+"""
+Reports and timing helpers shared by the benchmarks.
+
+Benchmarks are run from the root of the repository, as modules:
+
+    python -m benchmarks.build_time
+    python -m benchmarks.table_memory
+    python -m benchmarks.table_scaling
+    python -m benchmarks.text
+"""
+
+
+def rows(count: int) -> Iterator[dict[str, str]]:
+    """Rows of a consultation history, every one of them different."""
+    for i in range(count):
+        yield {
+            "data": "%02d/%02d/2024" % (i % 28 + 1, i % 12 + 1),
+            "descricao": "Consulta realizada %d" % i,
+            "usuario": "Usuário %d" % (i % 7),
+            "protocolo": "5202315259018723807912%06d" % i,
+        }
+
+
+def table_report(data: Iterable[dict[str, str]]) -> PDFBuilder:
+    builder = PDFBuilder(
+        header_data=HeaderData(category_name="Benchmark", product_name="Tabela")
+    )
+    builder.add_flowable(
+        Table(
+            "Histórico",
+            TableData(
+                columns={
+                    DictKey("data"): "Data",
+                    DictKey("descricao"): "Descrição",
+                    DictKey("usuario"): "Usuário",
+                    DictKey("protocolo"): "Protocolo",
+                },
+                data=data,
+            ),
+        )
+    )
+    return builder
+
+
+def best_of(repeat: int, function, *args) -> float:
+    """Shortest run of `function`, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
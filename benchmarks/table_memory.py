@@ -0,0 +1,57 @@
+from benchmarks.reports import rows, table_report
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+
+"""
+Peak memory of tables built from a list of rows and from an iterator.
+
+A list holds every row for the whole build, an iterator is read page by page
+and only the rows of the page being laid out are kept. What still grows with
+an iterator is the document reportlab keeps until the PDF is written: the
+content stream of every page, uncompressed, then the compressed PDF (whose
+size is shown). That part is the same for both sources.
+
+    python -m benchmarks.table_memory [--rows 10000 50000]
+"""
+
+
+def measure(count: int, source: str) -> tuple[float, float, int]:
+    """Memory the build peaked at, in bytes, seconds taken and PDF size."""
+    # Caches filled by the builds before stay in use, they are not counted
+    gc.collect()
+    in_use = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    start = time.perf_counter()
+
+    data = rows(count) if source == "iterator" else list(rows(count))
+    size = sum(len(chunk) for chunk in table_report(data).build_chunks())
+
+    elapsed = time.perf_counter() - start
+    return tracemalloc.get_traced_memory()[1] - in_use, elapsed, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Table peak memory")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10000, 50000])
+    args = parser.parse_args()
+
+    # Fonts, icons and caches are loaded before measuring
+    table_report(rows(10)).build_bytes()
+    tracemalloc.start()
+
+    for count in args.rows:
+        for source in ("list", "iterator"):
+            peak, elapsed, size = measure(count, source)
+            print(
+                "%7d rows  %-8s  peak %7.1f MB  pdf %6.1f MB  %6.1f s"
+                % (count, source, peak / 2**20, size / 2**20, elapsed),
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
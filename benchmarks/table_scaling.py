@@ -0,0 +1,53 @@
+from benchmarks.reports import rows, table_report
+
+import argparse
+import time
+
+
+"""
+Build time of a table against its number of rows.
+
+Rows are measured once per width and pages split off without measuring the
+rows left again, so the time per row stays flat from a thousand rows to a
+hundred thousand. A time per row growing with the table would mean splits
+going back over the rows.
+
+    python -m benchmarks.table_scaling [--rows 1000 5000 10000 50000 100000]
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Table build time by rows")
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[1000, 5000, 10000, 50000, 100000]
+    )
+    args = parser.parse_args()
+
+    # Fonts, icons and caches are loaded before timing
+    table_report(list(rows(50))).build_bytes()
+
+    per_row = []
+    for count in args.rows:
+        data = list(rows(count))
+        start = time.perf_counter()
+        table_report(data).build_bytes()
+        elapsed = time.perf_counter() - start
+
+        per_row.append(elapsed / count)
+        # Bars scaled so that the largest table takes about 60 columns when
+        # it scales linearly from the first one
+        bar = "#" * round(60 * elapsed / (per_row[0] * max(args.rows)))
+        print(
+            "%7d rows  %8.2f s  %6.1f us/row  %s"
+            % (count, elapsed, per_row[-1] * 1e6, bar),
+            flush=True,
+        )
+
+    print(
+        "time per row, largest against smallest table: %.2fx"
+        % (per_row[-1] / per_row[0])
+    )
+
+
+if __name__ == "__main__":
+    main()
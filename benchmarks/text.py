@@ -0,0 +1,83 @@
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+from src.primitives.text import PlainText
+from src.styles.stylesheet import CustomStyleSheet
+
+import argparse
+import io
+import time
+
+
+"""
+Plain text flowables against Paragraphs, on the texts of a report.
+
+Labels, headers and values without markup are laid out as PlainText, measured
+from cached glyph advances and drawn with drawString, instead of going through
+the markup parser of a Paragraph. Texts repeat from one layout to the next, so
+they are timed both repeated (the line cache hits) and all distinct.
+
+    python -m benchmarks.text [--count 20000]
+"""
+
+
+texts = [
+    "Risco baixo",
+    "Data de abertura:",
+    "Situação cadastral",
+    "Empresa de Teste Ltda (12.345.678/0001-90)",
+    "Página 3 de 12",
+    "Uma descrição um pouco mais longa que precisa quebrar em mais de uma linha",
+]
+
+
+def run(flowable_type, count: int, distinct: bool, draw: bool) -> float:
+    """Microseconds per text laid out, and drawn when `draw` is set."""
+    styles = CustomStyleSheet.shared()
+    style_list = [
+        styles.Body,
+        styles.Body_Bold_Right,
+        styles.Caption_70_Right,
+        styles.Subtitle,
+        styles.Caption_Bold_Center,
+    ]
+    canvas = Canvas(io.BytesIO())
+
+    start = time.perf_counter()
+    for i in range(count):
+        text = texts[i % len(texts)]
+        if distinct:
+            text = "%s %d" % (text, i)
+
+        flowable = flowable_type(text, style_list[i % len(style_list)])
+        flowable.wrapOn(canvas, 180, 1)
+        if draw:
+            flowable.drawOn(canvas, 10, 10)
+
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PlainText against Paragraph")
+    parser.add_argument("--count", type=int, default=20000)
+    args = parser.parse_args()
+
+    for distinct in (False, True):
+        for draw in (False, True):
+            times = [
+                run(flowable_type, args.count, distinct, draw)
+                for flowable_type in (Paragraph, PlainText)
+            ]
+            print(
+                "%-8s %-9s  Paragraph %6.1f us  PlainText %6.1f us  %.1fx faster"
+                % (
+                    "distinct" if distinct else "repeated",
+                    "wrap+draw" if draw else "wrap",
+                    *times,
+                    times[0] / times[1],
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+from typing import Any, Callable, TypeVar
+
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import tempfile
+
+import reportlab
+import svglib
+
+
+"""
+On-disk cache of prepared assets (parsed fonts, icon drawings).
+
+Entries are keyed by the asset's path and content hash plus a version string
+covering this cache format and the reportlab/svglib/python versions that
+produced them, so editing an asset or upgrading a dependency invalidates them
+automatically. Entries are read through a memory map.
+
+An edited asset replaces its entry of the same version. Entries of other
+versions are left alone, other environments sharing the directory may still
+use them; `prune()` deletes them.
+
+The directory defaults to ~/.cache/reportlab_sandbox and can be moved with the
+PDF_ASSET_CACHE_DIR environment variable, or disabled by setting it empty.
+Entries are unpickled, so the directory is created private to the user, and
+one that other users could write to (not owned by the current user, or group
+or world writable) is not used at all. Any cache failure falls back to
+building the asset from scratch.
+"""
+
+
+cache_format_version = 2
+
+cache_version = "v%s-rl%s-svg%s-py%s.%s" % (
+    cache_format_version,
+    reportlab.Version,
+    svglib.__version__,
+    *sys.version_info[:2],
+)
+
+
+T = TypeVar("T")
+
+
+def cache_dir() -> str | None:
+    default = os.path.join(os.path.expanduser("~"), ".cache", "reportlab_sandbox")
+    return os.environ.get("PDF_ASSET_CACHE_DIR", default) or None
+
+
+def cached(
+    kind: str,
+    path: str,
+    build: Callable[[], T],
+    dump: Callable[[T], Any] = lambda value: value,
+    load: Callable[[Any], T] = lambda payload: payload,
+) -> T:
+    """
+    Returns the asset at `path` from the cache, or builds it with `build` and
+    stores it. `dump`/`load` convert to and from a picklable payload for
+    objects that do not pickle as they are.
+    """
+    directory = cache_dir()
+    if directory is None:
+        return build()
+
+    prefix = "%s-%s-%s-%s-" % (
+        kind,
+        os.path.basename(path),
+        _path_digest(path),
+        cache_version,
+    )
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not _trusted(directory):
+            return build()
+
+        entry = os.path.join(directory, prefix + _digest(path) + ".pickle")
+    except OSError:
+        return build()
+
+    try:
+        return load(_read(entry))
+    except Exception:
+        pass
+
+    value = build()
+
+    try:
+        _write(directory, prefix, entry, dump(value))
+    except Exception:
+        pass
+
+    return value
+
+
+def prune():
+    """Deletes the entries written by other versions of the cache."""
+    directory = cache_dir()
+    if directory is None or not os.path.isdir(directory):
+        return
+
+    for name in os.listdir(directory):
+        if name.endswith(".pickle") and "-%s-" % cache_version not in name:
+            try:
+                os.unlink(os.path.join(directory, name))
+            except OSError:
+                pass
+
+
+def _digest(path: str) -> str:
+    with open(path, "rb") as file:
+        return hashlib.sha256(file.read()).hexdigest()[:32]
+
+
+def _path_digest(path: str) -> str:
+    # Tells apart assets with the same name in different directories
+    return hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:12]
+
+
+def _trusted(directory: str) -> bool:
+    # Whether only the current user can add or replace entries
+    if not hasattr(os, "getuid"):
+        return True
+
+    info = os.stat(directory)
+    return info.st_uid == os.getuid() and not info.st_mode & 0o022
+
+
+def _read(entry: str) -> Any:
+    with open(entry, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return pickle.loads(data)
+
+
+def _write(directory: str, prefix: str, entry: str, payload: Any):
+    # Entries of the same asset and version are replaced, not accumulated
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name != os.path.basename(entry):
+            try:
+                os.unlink(os.path.join(directory, name))
+            except OSError:
+                pass
+
+    # Written aside and renamed, so concurrent workers never read a partial entry
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            pickle.dump(payload, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, entry)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
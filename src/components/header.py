@@ -1,15 +1,26 @@
 from reportlab.platypus import (
-    BaseDocTemplate,
     Frame,
     Flowable,
-    Paragraph,
     Spacer,
 )
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.text import Text
+
 from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 
+from typing import Final, TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from src.pdf_builder import ReportDocTemplate
+
+
+static_form_name: Final[str] = "header_static"
+pagination_form_template: Final[str] = "header_pagination_%s"
+
 
 class HeaderData:
 
@@ -36,11 +47,51 @@ class HeaderData:
 
 def Header(
     canvas: Canvas,
-    doc: BaseDocTemplate,
+    doc: "ReportDocTemplate",
     header_data: HeaderData,
-    styles: CustomStyleSheet = CustomStyleSheet(),
+    styles: CustomStyleSheet = CustomStyleSheet.shared(),
     debug_flag: int = 0,
 ):
+    # Everything but the pagination is the same on every page, so it is laid
+    # out once per document as a form and only referenced on the next pages.
+    if doc.pagination_anchor is None:
+        canvas.beginForm(static_form_name)
+        doc.pagination_anchor = _StaticHeader(canvas, header_data, styles, debug_flag)
+        canvas.endForm()
+
+    canvas.doForm(static_form_name)
+
+    if header_data.total_pages:
+        _Pagination(canvas, header_data, doc.page, doc.pagination_anchor, styles)
+    else:
+        # total_pages is only known at the end of the build, see HeaderPagination
+        canvas.doForm(pagination_form_template % doc.page)
+
+
+def HeaderPagination(
+    canvas: Canvas,
+    doc: "ReportDocTemplate",
+    header_data: HeaderData,
+    styles: CustomStyleSheet = CustomStyleSheet.shared(),
+):
+    anchor = doc.pagination_anchor
+    if anchor is None:
+        # No page was drawn, so no header refers to a pagination form
+        return
+
+    for page in range(1, header_data.total_pages + 1):
+        canvas.beginForm(pagination_form_template % page)
+        _Pagination(canvas, header_data, page, anchor, styles)
+        canvas.endForm()
+
+
+def _StaticHeader(
+    canvas: Canvas,
+    header_data: HeaderData,
+    styles: CustomStyleSheet,
+    debug_flag: int,
+) -> tuple[float, float, float]:
+    """Draws the header and returns where its pagination line goes."""
     PAGE_WIDTH, PAGE_HEIGHT = canvas._pagesize
 
     left_story: list[Flowable] = []
@@ -72,10 +123,10 @@ def Header(
         showBoundary=debug_flag,
     )
 
-    left_story.append(Paragraph(header_data.category_name, styles.Title))
-    left_story.append(Paragraph(header_data.product_name, styles.Subtitle))
+    left_story.append(Text(header_data.category_name, styles.Title))
+    left_story.append(Text(header_data.product_name, styles.Subtitle))
     left_story.append(
-        Paragraph(
+        Text(
             "%s (%s)" % (header_data.entity_name, header_data.entity_id),
             styles.Body,
         )
@@ -83,14 +134,56 @@ def Header(
 
     left_frame.addFromList(left_story, canvas)
 
-    right_story.append(Paragraph(header_data.date_time, styles.Body_Right))
-    right_story.append(Paragraph(header_data.protocol, styles.Caption_70_Right))
+    right_story.append(Text(header_data.date_time, styles.Body_Right))
+    right_story.append(Text(header_data.protocol, styles.Caption_70_Right))
     right_story.append(Spacer(1, Spacing.Gap))
-    right_story.append(
-        Paragraph(
-            header_data.pagination_template % (doc.page, header_data.total_pages),
-            styles.Caption_70_Right,
+    anchor = _PaginationAnchor(style=styles.Caption_70_Right)
+    right_story.append(anchor)
+
+    right_frame.addFromList(right_story, canvas)
+
+    if anchor.position is None:
+        # Lines too long for the header leave no room for the anchor, the
+        # pagination then goes at the bottom of the column
+        return (
+            right_frame._x1 + right_frame._leftPadding,
+            right_frame._y1p,
+            right_frame._getAvailableWidth(),
         )
+
+    return anchor.position
+
+
+def _Pagination(
+    canvas: Canvas,
+    header_data: HeaderData,
+    page: int,
+    anchor: tuple[float, float, float],
+    styles: CustomStyleSheet,
+):
+    x, y, width = anchor
+
+    pagination_para = Text(
+        header_data.pagination_template % (page, header_data.total_pages),
+        styles.Caption_70_Right,
     )
+    pagination_para.wrap(width, Spacing.HeaderHeight)
+    pagination_para.drawOn(canvas, x, y)
 
-    right_frame.addFromList(right_story, canvas)
+
+class _PaginationAnchor(Flowable):
+
+    def __init__(self, style: ParagraphStyle):
+        self.style = style
+        # Where it was drawn, on the page, with its width
+        self.position: tuple[float, float, float] | None = None
+
+    def wrap(self, aW, aH):
+        self.width = aW
+        self.height = self.style.leading
+
+        return (self.width, self.height)
+
+    def draw(self):
+        x, y = self.canv.absolutePosition(0, 0)
+        self.position = (x, y, self.width)
@@ -1,6 +1,7 @@
-from reportlab.platypus import Flowable, Frame, Spacer
+from reportlab.platypus import Frame, Spacer
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.title import TitlePrimitive
 from src.primitives.icon_card_list import (
     IconCardListPrimitive,
@@ -13,14 +14,14 @@ from src.enums import Spacing
 from math import ceil
 
 
-class IconCardList(Flowable):
+class IconCardList(CompositeFlowable):
 
     def __init__(self, title: str, items: list[IconCardData], debug_flag: int = 0):
         self.items = items
         self.title = title
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
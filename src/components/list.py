@@ -1,19 +1,20 @@
-from reportlab.platypus import Flowable, Frame, Spacer
+from reportlab.platypus import Frame, Spacer
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.title import TitlePrimitive
 from src.primitives.list import ListPrimitive, ListData
 
 from src.enums import Spacing
 
 
-class List(Flowable):
+class List(CompositeFlowable):
 
     def __init__(self, title: str, list_data: ListData, debug_flag: int = 0):
         self.title = title
         self.list_data = list_data
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
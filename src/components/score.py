@@ -1,8 +1,9 @@
-from reportlab.platypus import Flowable, Frame, Spacer
+from reportlab.platypus import Frame, Spacer
 from reportlab.pdfgen.canvas import Canvas
 
 from reportlab.lib.units import mm
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.title import TitlePrimitive
 from src.primitives.score_chart import ScoreChartPrimitive, ScoreData
 from src.primitives.score_text import ScoreTextPrimitive
@@ -10,14 +11,14 @@ from src.primitives.score_text import ScoreTextPrimitive
 from src.enums import Spacing
 
 
-class Score(Flowable):
+class Score(CompositeFlowable):
 
     def __init__(self, title: str, score_data: ScoreData, debug_flag: int = 0):
         self.title = title
         self.score_data = score_data
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -61,13 +62,13 @@ class Score(Flowable):
         )
 
 
-class ScoreGroup(Flowable):
+class ScoreGroup(CompositeFlowable):
 
     def __init__(self, score_data: ScoreData, debug_flag: int = 0):
         self.score_data = score_data
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -1,42 +1,65 @@
 from reportlab.platypus import Flowable, Frame, Spacer
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.title import TitlePrimitive
-from src.primitives.list import ListPrimitive, ListData
+from src.primitives.list import ListPrimitive, ListData, FormValue
 from src.primitives.table import TablePrimitive, TableData
 
 from src.enums import Spacing
 
 from src.types.misc import DictKey
 
+from typing import Final
 
-class Table(Flowable):
+
+aggregate_form_template: Final[str] = "table_aggregate_%s_%s"
+
+
+class Table(CompositeFlowable):
+
+    # As many rows as the available height holds are laid out
+    height_sensitive = True
 
     def __init__(self, title: str, table_data: TableData, debug_flag: int = 0):
         self.title = title
         self.table_data = table_data
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
-        self.max_width = aW
-        self.max_height = aH
+        # Aggregates are only known once every row is read: the overview draws
+        # them from forms the last page of the table fills in.
+        self.aggregate_values = {
+            label: FormValue(aggregate_form_template % (id(self), index))
+            for index, label in enumerate(self.table_data.aggregates)
+        }
 
-        self.title_primitive = TitlePrimitive(self.title, debug_flag=self.debug_flag)
+    def startDocument(self):
+        # Rows are read from the start and added up again for every document
+        self.table_data.startLayout()
+
+        # Kept across wraps, it holds the rows already pulled from the data and
+        # the pages drawn against the limits, so one per document
         self.table_primitive = TablePrimitive(
-            self.table_data, debug_flag=self.debug_flag
+            self.table_data,
+            debug_flag=self.debug_flag,
+            overview_values=self.aggregate_values,
         )
 
+    def layout(self, aW, aH):
+        self.max_width = aW
+        self.max_height = aH
+
+        self.title_primitive = TitlePrimitive(self.title, debug_flag=self.debug_flag)
         self.title_primitive.wrapOn(self.canv, self.max_width, 1)
-        self.table_primitive.wrapOn(self.canv, self.max_width, 1)
 
-        self.height = (
-            self.title_primitive.height + self.table_primitive.height + Spacing.Gap
-        )
+        self.head_height = self.title_primitive.height + Spacing.Gap
+
+        overview = {**self.table_data.overview, **self.aggregate_values}
 
         self.list_primitive = None
-        if self.table_data.overview:
+        if overview:
             overview_data = ListData(
-                items=self.table_data.overview,
-                fields={DictKey(key): key for key in self.table_data.overview.keys()},
+                items=overview,
+                fields={DictKey(key): key for key in overview.keys()},
             )
             self.list_primitive = ListPrimitive(
                 overview_data, debug_flag=self.debug_flag
@@ -44,33 +67,24 @@ class Table(Flowable):
 
             self.list_primitive.wrapOn(self.canv, self.max_width, 1)
 
-            self.height += self.list_primitive.height + Spacing.Gap
+            self.head_height += self.list_primitive.height + Spacing.Gap
+
+        self.table_primitive.wrapOn(
+            self.canv, self.max_width, self.max_height - self.head_height
+        )
+
+        self.height = self.head_height + self.table_primitive.height
 
         return (self.max_width, self.height)
 
     def split(self, aW, aH):
-        header_height, first_row_height, *_ = self.table_primitive.table._rowHeights
-        overview_height = (
-            self.list_primitive.height + Spacing.Gap if self.list_primitive else 0
-        )
-        min_height = (
-            self.title_primitive.height
-            + Spacing.Gap
-            + overview_height
-            + int(header_height or 0)
-            + int(first_row_height or 0)
-        )
+        self.wrap(aW, aH)
 
-        if aH < min_height:
+        table_parts = self.table_primitive.splitOn(self.canv, aW, aH - self.head_height)
+        if not table_parts:
             return []
 
-        return [
-            self.title_primitive,
-            Spacer(1, Spacing.Gap),
-            self.list_primitive,
-            Spacer(1, Spacing.Gap) if self.list_primitive else None,
-            *self.table_primitive.split(aW, aH),
-        ]
+        return [*self.headStory(), *table_parts]
 
     def draw(self):
 
@@ -86,11 +100,12 @@ class Table(Flowable):
             showBoundary=self.debug_flag,
         )
 
-        frame.addFromList(
-            [
-                self.title_primitive,
-                Spacer(1, Spacing.Gap),
-                self.table_primitive,
-            ],
-            self.canv,
-        )
+        frame.addFromList([*self.headStory(), self.table_primitive], self.canv)
+
+    def headStory(self) -> list[Flowable]:
+        story: list[Flowable] = [self.title_primitive, Spacer(1, Spacing.Gap)]
+
+        if self.list_primitive:
+            story += [self.list_primitive, Spacer(1, Spacing.Gap)]
+
+        return story
@@ -0,0 +1,162 @@
+from datetime import date, datetime
+from typing import Any, Final, Iterable
+
+
+"""
+pt-BR display formatters for raw values: numbers, currency, masked documents
+(CPF, CNPJ, CEP), dates and percentages.
+
+A formatter is declared once per column or field and memoizes its results by
+value, so a column is formatted as a batch of its distinct values: dates,
+statuses and amounts that repeat from row to row are only formatted once.
+"""
+
+
+CPF: Final[str] = "###.###.###-##"
+CNPJ: Final[str] = "##.###.###/####-##"
+CEP: Final[str] = "#####-###"
+
+compact_scales: Final = ((1_000_000_000, "B"), (1_000_000, "M"), (1000, "K"))
+
+# Distinct values a formatter keeps before starting over
+max_memoized: Final[int] = 4096
+
+
+def format_number(value: float, decimals: int = 0) -> str:
+    """Number with pt-BR separators: 1.234,56"""
+    text = "{:,.{}f}".format(value, decimals)
+    return text.replace(",", "_").replace(".", ",").replace("_", ".")
+
+
+def parse_number(value: Any) -> float:
+    """Numbers as they come: 1234.56, "1234.56" or "1.234,56"."""
+    if value is None or value == "":
+        return 0.0
+    if isinstance(value, str) and "," in value:
+        value = value.replace(".", "").replace(",", ".")
+    return float(value)
+
+
+class Formatter:
+    """
+    Display text of raw values. Empty values stay empty, the others are
+    formatted once per distinct value.
+    """
+
+    def __init__(self):
+        self.memo: dict[Any, str] = {}
+
+    def format(self, value: Any) -> str:
+        raise NotImplementedError
+
+    def __call__(self, value: Any) -> str:
+        if value is None or value == "":
+            return ""
+
+        try:
+            return self.memo[value]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable values are not memoized
+            return self.format(value)
+
+        if len(self.memo) >= max_memoized:
+            self.memo.clear()
+
+        text = self.memo[value] = self.format(value)
+        return text
+
+    def batch(self, values: Iterable[Any]) -> list[str]:
+        return [self(value) for value in values]
+
+
+class Number(Formatter):
+    def __init__(self, decimals: int = 0):
+        super().__init__()
+        self.decimals = decimals
+
+    def format(self, value: Any) -> str:
+        return format_number(parse_number(value), self.decimals)
+
+
+class Currency(Formatter):
+    """
+    Amounts in reais, "R$ 1.234,56". `cents` reads integer amounts in cents,
+    `compact` shortens thousands and millions: "R$127K", "R$1,2M".
+    """
+
+    def __init__(self, cents: bool = False, compact: bool = False, symbol="R$"):
+        super().__init__()
+        self.cents = cents
+        self.compact = compact
+        self.symbol = symbol
+
+    def format(self, value: Any) -> str:
+        amount = parse_number(value)
+        if self.cents:
+            amount /= 100
+
+        sign = "-" if amount < 0 else ""
+        amount = abs(amount)
+
+        if self.compact:
+            for index, (scale, suffix) in enumerate(compact_scales):
+                if amount >= scale:
+                    scaled = amount / scale
+                    if index and round(scaled, 1 if scaled < 10 else 0) >= 1000:
+                        # Rounds up to the next scale: R$1M, not R$1.000K
+                        scale, suffix = compact_scales[index - 1]
+                        scaled = amount / scale
+
+                    text = format_number(scaled, 1 if scaled < 10 else 0)
+                    return sign + self.symbol + text.replace(",0", "") + suffix
+
+        return "%s%s %s" % (sign, self.symbol, format_number(amount, 2))
+
+
+class Mask(Formatter):
+    """
+    Document numbers written over a pattern of "#" digits, like the CPF, CNPJ
+    and CEP ones. Leading zeros lost by integers are put back; values with
+    more digits than the pattern are left as they are.
+    """
+
+    def __init__(self, pattern: str):
+        super().__init__()
+        self.pattern = pattern
+        self.digits = pattern.count("#")
+
+    def format(self, value: Any) -> str:
+        digits = "".join(char for char in str(value) if char.isdigit())
+        if len(digits) > self.digits:
+            return str(value)
+
+        chars = iter(digits.zfill(self.digits))
+        return "".join(next(chars) if char == "#" else char for char in self.pattern)
+
+
+class Date(Formatter):
+    """Dates and times, from date objects or ISO 8601 text, as "12/04/2024"."""
+
+    def __init__(self, pattern: str = "%d/%m/%Y"):
+        super().__init__()
+        self.pattern = pattern
+
+    def format(self, value: Any) -> str:
+        if not isinstance(value, date):
+            value = datetime.fromisoformat(str(value))
+        return value.strftime(self.pattern)
+
+
+class Percent(Formatter):
+    """Percentages, "12,5%". `ratio` reads values as fractions of 1."""
+
+    def __init__(self, decimals: int = 1, ratio: bool = True):
+        super().__init__()
+        self.decimals = decimals
+        self.ratio = ratio
+
+    def format(self, value: Any) -> str:
+        percent = parse_number(value) * (100 if self.ratio else 1)
+        return format_number(percent, self.decimals) + "%"
@@ -0,0 +1,68 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from src.pdf_builder import PDFBuilder
+
+import asyncio
+import threading
+
+
+"""
+asyncio facade over PDFBuilder.
+
+Layout runs on a thread executor so it never blocks the event loop, at most
+`max_concurrency` reports are laid out at once, and a render that is cancelled
+or times out stops its layout before the next flowable instead of finishing
+in the background.
+"""
+
+
+class AsyncRenderer:
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        timeout: float | None = None,
+        executor: Executor | None = None,
+    ):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="pdf-render"
+        )
+
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def render(self, builder: PDFBuilder, timeout: float | None = None) -> bytes:
+        timeout = timeout if timeout is not None else self.timeout
+
+        # The slot is held until the layout thread is done, which after a
+        # timeout or cancellation is later than the end of this coroutine
+        await self.semaphore.acquire()
+        loop = asyncio.get_running_loop()
+        cancel_event = threading.Event()
+
+        try:
+            future = self.executor.submit(builder.build_bytes, cancel_event)
+        except BaseException:
+            self.semaphore.release()
+            raise
+        future.add_done_callback(lambda _: self._release(loop))
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        except BaseException:
+            # Timeouts and cancellations (e.g. client disconnected) do not
+            # stop an executor thread, the builder checks this flag instead.
+            cancel_event.set()
+            raise
+
+    def _release(self, loop: asyncio.AbstractEventLoop):
+        # Called from the thread that finished or cancelled the layout
+        try:
+            loop.call_soon_threadsafe(self.semaphore.release)
+        except RuntimeError:
+            # The loop is closed, nothing waits for the slot anymore
+            pass
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
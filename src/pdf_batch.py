@@ -0,0 +1,80 @@
+from multiprocessing import Pool
+
+from src.primitives.icon import loadIcons
+from src.styles.fonts import register_fonts
+
+from typing import Any, Callable, Iterable, Iterator
+
+import os
+import time
+
+
+"""
+Batch rendering over a pool of pre-warmed worker processes.
+
+A job is any picklable callable that renders one report, for example
+`functools.partial(AnaliseCredito.PJ.RelatorioPositivo, "out/0001.pdf")`.
+Module level functions and template classes pickle by reference, lambdas do not.
+"""
+
+
+RenderJob = Callable[[], Any]
+
+
+class RenderResult:
+
+    def __init__(
+        self,
+        index: int,
+        value: Any = None,
+        error: BaseException | None = None,
+        elapsed: float = 0,
+    ):
+        self.index = index
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def render_batch(
+    jobs: Iterable[RenderJob],
+    workers: int | None = None,
+    max_tasks_per_child: int | None = None,
+    chunksize: int = 1,
+) -> Iterator[RenderResult]:
+    """
+    Renders `jobs` on `workers` processes (defaults to the number of cores),
+    yielding a `RenderResult` as soon as each report finishes, in completion
+    order. Failed jobs are reported through `RenderResult.error` instead of
+    interrupting the batch. Workers are replaced after `max_tasks_per_child`
+    jobs to bound memory growth over long runs.
+    """
+    with Pool(
+        processes=workers or os.cpu_count(),
+        initializer=_init_worker,
+        maxtasksperchild=max_tasks_per_child,
+    ) as pool:
+        yield from pool.imap_unordered(_run_job, enumerate(jobs), chunksize)
+
+
+def _init_worker():
+    # Fonts and icons are parsed once per worker, so the jobs only pay for
+    # layout and rendering.
+    register_fonts()
+    loadIcons()
+
+
+def _run_job(indexed_job: tuple[int, RenderJob]) -> RenderResult:
+    index, job = indexed_job
+
+    start = time.perf_counter()
+    try:
+        value = job()
+    except Exception as error:
+        return RenderResult(index, error=error, elapsed=time.perf_counter() - start)
+
+    return RenderResult(index, value=value, elapsed=time.perf_counter() - start)
@@ -10,13 +10,15 @@ from reportlab.platypus import (
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen.canvas import Canvas
 
-from src.components.header import Header, HeaderData
+from src.components.header import Header, HeaderData, HeaderPagination
 
 from src.styles.stylesheet import CustomStyleSheet
 from src.enums import Spacing
 
+from typing import IO, Iterator
+
 import copy
-import io
+import threading
 
 
 PAGE_WIDTH, PAGE_HEIGHT = A4
@@ -38,18 +40,58 @@ the document from the other layers.
 """
 
 
-styles = CustomStyleSheet()
+styles = CustomStyleSheet.shared()
+
+
+PDFOutput = str | IO[bytes]
+
+
+class RenderCancelled(Exception):
+    pass
 
 
-total_pages = 0
+class ReportDocTemplate(BaseDocTemplate):
+
+    def __init__(self, filename: PDFOutput | None, header_data: HeaderData, **kwargs):
+        super().__init__(filename, **kwargs)
+        self.header_data = header_data
+        # Where the pagination line goes, found while laying out the static header
+        self.pagination_anchor: tuple[float, float, float] | None = None
 
 
 class PDFBuilder:
+    """
+    Builds a report from a story of flowables.
+
+    All per-document state (doc template, canvas, header data, page totals and
+    the position of the pagination) lives on the `ReportDocTemplate` created
+    by each `build()` call, so:
+
+    * different builders can be built concurrently from different threads;
+    * the same builder can be built more than once (its story is not consumed),
+      but not from two threads at the same time, since flowables keep
+      layout state between `wrap` and `draw`.
+
+    tests/test_concurrency.py holds both to the output of serial builds.
 
-    def __init__(self, filename: str, header_data: HeaderData = HeaderData()):
+    Output goes to a path or a writable file object (`build`), or stays in
+    memory (`build_bytes`, `build_chunks`) without being written anywhere.
+
+    Every build accepts a `cancel_event`: once it is set, layout stops before
+    the next flowable (or page of a split flowable) with `RenderCancelled`.
+    """
+
+    def __init__(
+        self,
+        filename: PDFOutput | None = None,
+        header_data: HeaderData | None = None,
+    ):
         self.filename = filename
-        self.header_data = header_data
+        self.header_data = header_data if header_data is not None else HeaderData()
+
+        self.story: list[Flowable] = []
 
+    def make_doc(self, filename: PDFOutput | None = None) -> ReportDocTemplate:
         frame_width = PAGE_WIDTH - 2 * Spacing.SafeMargin
         frame_height = (
             PAGE_HEIGHT - 2 * Spacing.SafeMargin - Spacing.HeaderHeight - Spacing.Gap
@@ -73,8 +115,13 @@ class PDFBuilder:
             onPage=self.page_builder,
         )
 
-        self.doc = BaseDocTemplate(
-            filename=self.filename,
+        # Each document gets its own copy, the page total is filled in per build
+        header_data = copy.copy(self.header_data)
+        header_data.total_pages = 0
+
+        doc = ReportDocTemplate(
+            filename=filename,
+            header_data=header_data,
             pageTemplates=[pageTemplate],
             pagesize=A4,
             rightMargin=Spacing.SafeMargin,
@@ -84,30 +131,79 @@ class PDFBuilder:
             showBoundary=reportlab_debug,
         )
 
-        self.story: list[Flowable] = []
+        return doc
 
-    def page_builder(self, canvas: Canvas, doc: BaseDocTemplate):
+    def page_builder(self, canvas: Canvas, doc: ReportDocTemplate):
         canvas.saveState()
         self.build_header(canvas, doc)
         canvas.restoreState()
 
-    def build_header(self, canvas: Canvas, doc: BaseDocTemplate):
-        global total_pages
-        total_pages = max(total_pages, doc.page)
+    def build_header(self, canvas: Canvas, doc: ReportDocTemplate):
+        Header(canvas, doc, doc.header_data, debug_flag=reportlab_debug)
 
-        self.header_data.total_pages = total_pages
-        Header(canvas, doc, self.header_data, debug_flag=reportlab_debug)
+    def build_pagination(self, canvas: Canvas, doc: ReportDocTemplate):
+        doc.header_data.total_pages = doc.page
+        HeaderPagination(canvas, doc, doc.header_data)
 
     def add_flowable(self, flowable: Flowable):
         self.story.append(flowable)
         self.story.append(Spacer(1, Spacing.Gap * 2))
 
-    def build(self):
-        with io.BytesIO() as out:
-            doc = copy.deepcopy(self.doc)
-            doc.build(copy.deepcopy(self.story), out)
-
-        self.doc.build(self.story)
-
-        global total_pages
-        total_pages = 0
+    def build(
+        self,
+        output: PDFOutput | None = None,
+        cancel_event: threading.Event | None = None,
+    ):
+        output = output if output is not None else self.filename
+        if output is None:
+            raise ValueError("PDFBuilder.build needs a filename or a file object")
+
+        doc = self.layout(output, cancel_event)
+        doc.canv.save()
+
+    def build_bytes(self, cancel_event: threading.Event | None = None) -> bytes:
+        doc = self.layout(cancel_event=cancel_event)
+        return doc.canv.getpdfdata()
+
+    def build_chunks(
+        self,
+        chunk_size: int = 64 * 1024,
+        cancel_event: threading.Event | None = None,
+    ) -> Iterator[memoryview]:
+        # Slices of a memoryview share the finished buffer, nothing is copied
+        data = memoryview(self.build_bytes(cancel_event))
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    def layout(
+        self,
+        filename: PDFOutput | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> ReportDocTemplate:
+        doc = self.make_doc(filename)
+
+        if cancel_event is not None:
+            # Called by platypus after every handled flowable and page
+            doc.setProgressCallBack(
+                lambda typ, value: self.check_cancelled(cancel_event)
+            )
+
+        # Single pass: the header leaves a placeholder for the total page count,
+        # which is filled in after layout and before the canvas is saved.
+        doc._doSave = 0
+
+        for flowable in self.story:
+            # Left by platypus on flowables it moved to the next page, a second
+            # move would then be taken for a flowable that never fits
+            flowable.__dict__.pop("_postponed", None)
+
+        doc.build(list(self.story))
+
+        self.build_pagination(doc.canv, doc)
+
+        return doc
+
+    @staticmethod
+    def check_cancelled(cancel_event: threading.Event):
+        if cancel_event.is_set():
+            raise RenderCancelled()
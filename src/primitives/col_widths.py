@@ -0,0 +1,158 @@
+from reportlab.platypus import Paragraph
+from reportlab.platypus.tables import CellStyle
+
+from src.primitives.metrics import text_widths
+from src.types.components import TableData
+from src.types.components.table import ColumnWidth, Row
+
+from functools import lru_cache
+from typing import Final, Iterable, Iterator
+
+
+"""
+Column widths from font metrics.
+
+The widest sampled value of each column, measured with the font the cells are
+drawn in, sets the column minimum. Dictionary encoded columns know all their
+distinct values, so every one of them is measured instead of a sample; the
+space left is shared between the columns without a width hint the same way
+reportlab sizes a Table with auto widths.
+"""
+
+
+# Style reportlab gives plain cells, the rows are drawn with it
+cell_style: Final[CellStyle] = CellStyle("table_cell")
+
+cell_padding_x: Final[float] = cell_style.leftPadding + cell_style.rightPadding
+cell_padding_y: Final[float] = cell_style.topPadding + cell_style.bottomPadding
+
+
+def estimate_col_widths(
+    table_data: TableData, header: list[Paragraph], avail_width: float
+) -> list[float]:
+    minimums = column_minimums(table_data, header)
+
+    return list(
+        _distribute(avail_width, tuple(minimums), tuple(table_data.width_hints))
+    )
+
+
+def column_minimums(table_data: TableData, header: list[Paragraph]) -> list[float]:
+    widest = [para.minWidth() for para in header]
+
+    distinct = [table_data.distinct_values(key) for key in table_data.columns]
+    sampled: list[set[str]] = [set() for _ in header]
+
+    if any(values is None for values in distinct):
+        for row in sample_rows(table_data):
+            for col, cell in enumerate(table_data.cells(row)):
+                if distinct[col] is None:
+                    sampled[col].add(str(cell) if cell is not None else "")
+
+    for col, values in enumerate(distinct):
+        widths = cell_widths(
+            values if values is not None else sampled[col],
+            cell_style.fontname,
+            cell_style.fontsize,
+        )
+        widest[col] = max([widest[col], *widths])
+
+    return [width + cell_padding_x for width in widest]
+
+
+def cell_widths(texts: Iterable[str], font_name: str, font_size: float) -> list[float]:
+    """Widths of a batch of cell texts, the widest line of each."""
+    texts = [str(text) for text in texts]
+
+    widths = {}
+    for text in set(texts):
+        widths[text] = max(text_widths(text.split("\n"), font_name, font_size))
+
+    return [widths[text] for text in texts]
+
+
+def sample_rows(table_data: TableData) -> Iterator[Row]:
+    """
+    The first `width_sample` rows, or as many rows spread evenly over the data
+    for "stratified" sampling. Iterators can only be sampled from the head.
+    """
+    size = table_data.width_sample
+    count = table_data.rows.count()
+
+    if table_data.width_sampling == "stratified" and count and count > size:
+        indexes = (i * count // size for i in range(size))
+    else:
+        indexes = iter(range(size))
+
+    for index in indexes:
+        row = table_data.rows.get(index)
+        if row is None:
+            return
+        yield row
+
+
+@lru_cache(maxsize=256)
+def _distribute(
+    avail_width: float,
+    minimums: tuple[float, ...],
+    hints: tuple[ColumnWidth, ...],
+) -> tuple[float, ...]:
+    widths: list[float] = [0] * len(minimums)
+    auto: list[int] = []
+
+    for col, hint in enumerate(hints):
+        if hint is None:
+            auto.append(col)
+        elif isinstance(hint, str) and hint.endswith("%"):
+            widths[col] = avail_width * float(hint[:-1]) / 100
+        else:
+            widths[col] = float(hint)
+
+    if not auto:
+        return tuple(widths)
+
+    free_width = avail_width - sum(widths)
+    total_minimum = sum(minimums[col] for col in auto)
+    remaining = free_width - total_minimum
+
+    if remaining <= 0:
+        # Not even the minimums fit, they are shrunk to whatever is left
+        scale = free_width / total_minimum if free_width > 0 else 1
+        for col in auto:
+            widths[col] = minimums[col] * scale
+        return tuple(widths)
+
+    # Every auto column wants an equal share of the free width. The ones whose
+    # content is wider keep their minimum, the others split what is left.
+    desired = free_width / len(auto)
+
+    wanting = []
+    total_desired = 0.0
+    effective_remaining = remaining
+    for col in auto:
+        if desired <= minimums[col]:
+            widths[col] = minimums[col]
+        else:
+            wanting.append((desired - minimums[col], minimums[col], col))
+            total_desired += desired
+            effective_remaining += minimums[col]
+
+    if not wanting:
+        return tuple(widths)
+
+    proportion = effective_remaining / total_desired
+    final = []
+    for _, minimum, col in sorted(wanting):
+        if proportion * desired < minimum:
+            widths[col] = minimum
+            total_desired -= desired
+            effective_remaining -= minimum
+            if total_desired:
+                proportion = effective_remaining / total_desired
+        else:
+            final.append(col)
+
+    for col in final:
+        widths[col] = proportion * desired
+
+    return tuple(widths)
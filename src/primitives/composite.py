@@ -0,0 +1,63 @@
+from reportlab.platypus import Flowable
+from reportlab.pdfgen.canvas import Canvas
+
+from weakref import ref
+
+
+"""
+Flowables laid out from child flowables.
+
+Platypus wraps the same flowable several times: from the wrapOn of its parent,
+again from Frame.add while the parent draws, and again around splits. The
+components here build and wrap all of their children on every wrap, so a
+composite only lays itself out once per available size and keeps its children
+from that layout.
+"""
+
+
+class CompositeFlowable(Flowable):
+    """
+    Flowable whose `layout` builds and wraps its children. `wrap` only calls
+    it when the available size changes, and otherwise returns the size of the
+    last layout with the children it made.
+
+    Composites are as tall as their children and ignore the available height
+    unless `height_sensitive` is set, so the height a frame offers them while
+    drawing does not count as a new size. Call `invalidate` after changing the
+    data a composite was laid out from.
+
+    A story can be built more than once: wrapped on the canvas of another
+    document, a composite starts over, `startDocument` is called before its
+    first layout there.
+    """
+
+    height_sensitive: bool = False
+
+    _wrap_key: tuple[float, float | None] | None = None
+    _wrap_size: tuple[float, float] = (0, 0)
+    _canvas: "ref[Canvas] | None" = None
+
+    def layout(self, aW, aH) -> tuple[float, float]:
+        raise NotImplementedError
+
+    def startDocument(self):
+        pass
+
+    def wrap(self, aW, aH):
+        canvas = getattr(self, "canv", None)
+        if canvas is not None and (
+            self._canvas is None or self._canvas() is not canvas
+        ):
+            self._canvas = ref(canvas)
+            self._wrap_key = None
+            self.startDocument()
+
+        key = (aW, aH if self.height_sensitive else None)
+        if key != self._wrap_key:
+            self._wrap_size = self.layout(aW, aH)
+            self._wrap_key = key
+
+        return self._wrap_size
+
+    def invalidate(self):
+        self._wrap_key = None
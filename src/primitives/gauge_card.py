@@ -1,9 +1,11 @@
-from reportlab.platypus import Flowable, Paragraph, Frame
+from reportlab.platypus import Flowable, Frame
 from reportlab.pdfgen.canvas import Canvas
 
 from reportlab.lib.units import mm
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.icon import Icon
+from src.primitives.text import Text
 
 from src.enums import Colors, Spacing, SvgPath
 from src.styles.stylesheet import CustomStyleSheet
@@ -12,16 +14,19 @@ from src.types.components import GaugeCardData
 from typing import Final
 
 
-class GaugeCardPrimitive(Flowable):
+class GaugeCardPrimitive(CompositeFlowable):
 
     def __init__(
-        self, card_data: GaugeCardData, styles=CustomStyleSheet(), debug_flag: int = 0
+        self,
+        card_data: GaugeCardData,
+        styles=CustomStyleSheet.shared(),
+        debug_flag: int = 0,
     ):
         self.card_data = card_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -35,7 +40,7 @@ class GaugeCardPrimitive(Flowable):
             style=self.styles.Body,
             spaceAfter=2,
         )
-        self.title_para = Paragraph(
+        self.title_para = Text(
             text=self.card_data.title,
             style=title_styles,
         )
@@ -43,11 +48,11 @@ class GaugeCardPrimitive(Flowable):
             style=self.styles.Caption_70,
             spaceBefore=0,
         )
-        self.description_para = Paragraph(
+        self.description_para = Text(
             text=self.card_data.description,
             style=description_styles,
         )
-        self.value_para = Paragraph(
+        self.value_para = Text(
             text=self.card_data.level_text,
             style=self.styles.Body_Right,
         )
@@ -143,7 +148,7 @@ icon_size: Final[int] = int(3.8 * mm)
 gauges_count: Final[int] = 3
 
 
-class _Gauge(Flowable):
+class _Gauge(CompositeFlowable):
     def __init__(self, level: int, debug_flag: int = 0):
         self.level = level
         self.debug_flag = debug_flag
@@ -153,7 +158,7 @@ class _Gauge(Flowable):
         if level > gauges_count:
             self.level = gauges_count
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -1,26 +1,28 @@
-from reportlab.platypus import Flowable, Paragraph, Frame, Spacer
+from reportlab.platypus import Flowable, Frame, Spacer
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.gauge_card import GaugeCardPrimitive
+from src.primitives.text import Text
 
 from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import GaugeCardGroupData
 
 
-class GaugeCardGroupPrimitive(Flowable):
+class GaugeCardGroupPrimitive(CompositeFlowable):
 
     def __init__(
         self,
         group_data: GaugeCardGroupData,
-        styles=CustomStyleSheet(),
+        styles=CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.group_data = group_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -30,7 +32,7 @@ class GaugeCardGroupPrimitive(Flowable):
         self.left_story: list[Flowable] = []
         self.right_story: list[Flowable] = []
 
-        self.group_title = Paragraph(
+        self.group_title = Text(
             text=self.group_data.title,
             style=self.styles.Subtitle,
         )
@@ -1,5 +1,6 @@
 from reportlab.platypus import Flowable, Frame, Spacer
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.gauge_card_group import GaugeCardGroupPrimitive
 
 from src.enums import Spacing
@@ -7,19 +8,19 @@ from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import GaugeCardListData
 
 
-class GaugeCardListPrimitive(Flowable):
+class GaugeCardListPrimitive(CompositeFlowable):
 
     def __init__(
         self,
         list_data: GaugeCardListData,
-        styles=CustomStyleSheet(),
+        styles=CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.list_data = list_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
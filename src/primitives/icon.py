@@ -1,11 +1,117 @@
 from reportlab.platypus import Flowable
 
-from reportlab.graphics.shapes import Path
+from reportlab.graphics import renderPDF
+from reportlab.graphics.shapes import Drawing, Path
 
 from svglib.svglib import svg2rlg
 
+from src.asset_cache import cached
 from src.enums import Colors, SvgPath
 
+import copy
+import threading
+
+
+IconKey = tuple[SvgPath, int, int, Colors, float]
+
+
+_drawings: dict[SvgPath, Drawing | None] = {}
+_variants: dict[IconKey, Drawing | None] = {}
+
+# Drawings and variants are built once, whichever thread asks for them first
+_build_lock = threading.RLock()
+
+# The renderer marks the nodes of a drawing while it walks them, so a shared
+# drawing is rendered by one thread at a time
+_render_lock = threading.Lock()
+
+
+def loadIcons():
+    for svg_path in SvgPath:
+        _loadDrawing(svg_path)
+
+
+def getIconDrawing(
+    svg_path: SvgPath,
+    width: int = 0,
+    height: int = 0,
+    color: Colors = Colors.Black,
+    opacity: float = 1,
+) -> Drawing | None:
+    """
+    Returns the drawing of `svg_path` resized and tinted as requested.
+    Each variant is built once per process and shared, so it must not be
+    mutated by its users, and is only rendered under `_render_lock`.
+    """
+    key = (svg_path, width, height, color, opacity)
+
+    if key not in _variants:
+        with _build_lock:
+            if key not in _variants:
+                _variants[key] = _buildVariant(*key)
+    return _variants[key]
+
+
+def _loadDrawing(svg_path: SvgPath) -> Drawing | None:
+    if svg_path not in _drawings:
+        with _build_lock:
+            if svg_path not in _drawings:
+                _drawings[svg_path] = cached(
+                    "icon", svg_path.value, build=lambda: svg2rlg(svg_path.value)
+                )
+    return _drawings[svg_path]
+
+
+def _buildVariant(
+    svg_path: SvgPath, width: int, height: int, color: Colors, opacity: float
+) -> Drawing | None:
+    drawing = copy.deepcopy(_loadDrawing(svg_path))
+    if not drawing:
+        return None
+
+    if width:
+        _resizeWidth(drawing, width)
+    if height:
+        _resizeHeight(drawing, height)
+
+    for shape in _getShapes(drawing):
+        if hasattr(shape, "fillColor"):
+            shape.setProperties({"fillColor": Colors.getIconColor(color).value})
+        if hasattr(shape, "fillOpacity"):
+            shape.setProperties({"fillOpacity": opacity})
+
+    return drawing
+
+
+def _resizeWidth(drawing: Drawing, width: int):
+    scaling_factor = width / drawing.width
+    drawing.width = width
+    drawing.height = int(drawing.height * scaling_factor)
+    drawing.scale(scaling_factor, scaling_factor)
+
+
+def _resizeHeight(drawing: Drawing, height: int):
+    scaling_factor = height / drawing.height
+    drawing.width = int(drawing.width * scaling_factor)
+    drawing.height = height
+    drawing.scale(scaling_factor, scaling_factor)
+
+
+def _getShapes(drawing: Drawing) -> list[Path]:
+    shapes: list[Path] = []
+
+    next = drawing
+    while next:
+        if isinstance(next, Path):
+            shapes.append(next)
+
+        if hasattr(next, "contents"):
+            next = next.getProperties().get("contents", [])[0]
+        else:
+            next = None
+
+    return shapes
+
 
 class Icon(Flowable):
 
@@ -25,7 +131,7 @@ class Icon(Flowable):
         self.opacity = opacity
         self.debug_flag = debug_flag
 
-        self.icon = svg2rlg(self.svg_path.value)
+        self.icon = getIconDrawing(svg_path, width, height, color, opacity)
 
     def wrap(self, aW, aH):
         self.max_width = aW
@@ -34,11 +140,6 @@ class Icon(Flowable):
         if not self.icon:
             return (self.max_width, self.max_height)
 
-        if self.iWidth:
-            self.resizeWidth(self.iWidth)
-        if self.iHeight:
-            self.resizeHeight(self.iHeight)
-
         self.width = self.icon.width
         self.height = self.icon.height
 
@@ -48,67 +149,30 @@ class Icon(Flowable):
         if not self.icon:
             return
 
-        self.canv.saveState()
-
-        self.changeColor(self.color)
-        self.changeOpacity(self.opacity)
-
-        self.icon._showBoundary = self.debug_flag  # type: ignore
-
-        self.icon.drawOn(self.canv, 0, 0)
-
-        self.canv.restoreState()
-
-    def resizeWidth(self, width: int):
-        if not self.icon:
-            return
-        scaling_factor = width / self.icon.width
-        self.icon.width = width
-        self.icon.height = int(self.icon.height * scaling_factor)
-        self.icon.scale(scaling_factor, scaling_factor)
-
-    def resizeHeight(self, height: int):
-        if not self.icon:
-            return
-        scaling_factor = height / self.icon.height
-        self.icon.width = int(self.icon.width * scaling_factor)
-        self.icon.height = height
-        self.icon.scale(scaling_factor, scaling_factor)
-
-    def getShapes(self) -> list[Path]:
-        if not self.icon:
-            return []
-
-        shapes: list[Path] = []
-
-        next = self.icon
-        while next:
-            if isinstance(next, Path):
-                shapes.append(next)
-
-            if hasattr(next, "contents"):
-                next = next.getProperties().get("contents", [])[0]
-            else:
-                next = None
-
-        return shapes
-
-    def changeColor(self, color: Colors):
-        if not self.icon:
-            return
-
-        children: list[Path] = self.getShapes()
-
-        for shape in children:
-            if hasattr(shape, "fillColor"):
-                shape.setProperties({"fillColor": Colors.getIconColor(color).value})
-
-    def changeOpacity(self, opacity: float):
-        if not self.icon:
-            return
-
-        children: list[Path] = self.getShapes()
-
-        for shape in children:
-            if hasattr(shape, "fillOpacity"):
-                shape.setProperties({"fillOpacity": opacity})
+        # Each variant is emitted once per document as a form and referenced
+        # from then on, instead of repeating its path operators at every use.
+        form_name = self.formName()
+
+        if not self.canv.hasForm(form_name):
+            self.canv.beginForm(
+                form_name,
+                lowerx=-self.icon.width,
+                lowery=-self.icon.height,
+                upperx=self.icon.width * 2,
+                uppery=self.icon.height * 2,
+            )
+            with _render_lock:
+                renderPDF.draw(self.icon, self.canv, 0, 0, showBoundary=self.debug_flag)
+            self.canv.endForm()
+
+        self.canv.doForm(form_name)
+
+    def formName(self) -> str:
+        return "icon_%s_%s_%s_%s_%s_%s" % (
+            self.svg_path.name,
+            self.iWidth,
+            self.iHeight,
+            self.color.name,
+            self.opacity,
+            self.debug_flag,
+        )
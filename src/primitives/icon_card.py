@@ -1,46 +1,46 @@
-from reportlab.platypus import Flowable, Paragraph, Frame
+from reportlab.platypus import Frame
 from reportlab.pdfgen.canvas import Canvas
 
 from reportlab.lib.units import mm
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.icon import Icon
+from src.primitives.text import Text
 
-from src.enums import Colors, Spacing
+from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import IconCardData
 
 from typing import Final
 
 
-class IconCardPrimitive(Flowable):
+class IconCardPrimitive(CompositeFlowable):
     icon_frame_width: Final[float] = 13 * mm
 
     def __init__(
         self,
         icon_card_data: IconCardData,
-        styles: CustomStyleSheet = CustomStyleSheet(),
+        styles: CustomStyleSheet = CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.icon_card_data = icon_card_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
         title_styles = self.styles.customStyle(
-            style=self.styles.Subtitle,
-            textColor=Colors.getTextColor(self.icon_card_data.color).value,
+            style=self.styles.textOn(self.styles.Subtitle, self.icon_card_data.color),
             spaceAfter=2,
         )
-        self.title_para = Paragraph(self.icon_card_data.title, title_styles)
+        self.title_para = Text(self.icon_card_data.title, title_styles)
         description_styles = self.styles.customStyle(
-            style=self.styles.Body,
-            textColor=Colors.getTextColor(self.icon_card_data.color).value,
+            style=self.styles.textOn(self.styles.Body, self.icon_card_data.color),
             spaceBefore=0,
         )
-        self.description_para = Paragraph(
+        self.description_para = Text(
             self.icon_card_data.description, description_styles
         )
 
@@ -1,19 +1,20 @@
 from reportlab.platypus import Flowable, Frame, Spacer
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.composite import CompositeFlowable
 from src.primitives.icon_card import IconCardPrimitive, IconCardData
 
 from src.enums import Spacing
 from src.types.components import IconCardData
 
 
-class IconCardListPrimitive(Flowable):
+class IconCardListPrimitive(CompositeFlowable):
 
     def __init__(self, items: list[IconCardData], debug_flag: int = 0):
         self.items = items
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
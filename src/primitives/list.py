@@ -1,6 +1,11 @@
-from reportlab.platypus import Flowable, Paragraph, Frame, Spacer
+from reportlab.platypus import Flowable, Frame, Spacer
+from reportlab.lib.styles import ParagraphStyle
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.composite import CompositeFlowable
+from src.primitives.text import Text, text_extent
+from src.primitives.text_fit import fit_text
+
 from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import ListData
@@ -15,19 +20,19 @@ padding_x: Final[int] = Spacing.Padding
 padding_y: Final[int] = Spacing.Padding
 
 
-class ListPrimitive(Flowable):
+class ListPrimitive(CompositeFlowable):
 
     def __init__(
         self,
         list_data: ListData,
-        styles: CustomStyleSheet = CustomStyleSheet(),
+        styles: CustomStyleSheet = CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.list_data = list_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -36,18 +41,18 @@ class ListPrimitive(Flowable):
 
         index = 0
         for key, value in self.list_data.fields.items():
-            field_para = Paragraph(field_template % value, self.styles.Body_Bold_Right)
-            field_para.wrapOn(self.canv, self.max_width, 1)
+            field_width = text_extent(
+                field_template % value, self.styles.Body_Bold_Right, self.max_width
+            )
 
             if index % 2 == 0:
-                if field_para._width_max > self.max_field_width_left:
-                    self.max_field_width_left = field_para._width_max
+                if field_width > self.max_field_width_left:
+                    self.max_field_width_left = field_width
             else:
-                if field_para._width_max > self.max_field_width_right:
-                    self.max_field_width_right = field_para._width_max
+                if field_width > self.max_field_width_right:
+                    self.max_field_width_right = field_width
 
             index += 1
-            del field_para
 
         self.height_left = 0
         self.height_right = 0
@@ -57,7 +62,7 @@ class ListPrimitive(Flowable):
         index = 0
         for key, value in self.list_data.fields.items():
             row_value = self.list_data.items.get(key, "")
-            value_para = Paragraph(str(row_value), self.styles.Body)
+            value_para = Text(str(row_value), self.styles.Body)
 
             if index % 2 == 0:
                 value_para.wrapOn(
@@ -151,35 +156,36 @@ class ListPrimitive(Flowable):
         right_frame.addFromList(right_story, canvas)
 
 
-class ListRow(Flowable):
+class ListRow(CompositeFlowable):
 
     def __init__(
         self,
         field: str,
         value: str,
         field_width: float,
-        styles: CustomStyleSheet = CustomStyleSheet(),
+        styles: CustomStyleSheet = CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.field = field
         self.value = str(value)
+        self.form_value = value if isinstance(value, FormValue) else None
         self.field_width = field_width
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
-        self.field_para = Paragraph(
-            field_template % self.field, self.styles.Body_Bold_Right
-        )
+        self.field_para = Text(field_template % self.field, self.styles.Body_Bold_Right)
         self.field_para.wrapOn(self.canv, self.field_width, 1)
 
-        self.value_para = Paragraph(self.value, self.styles.Body)
+        self.value_para = Text(self.value, self.styles.Body)
         self.value_para.wrapOn(
             self.canv, self.max_width - self.field_width - Spacing.Padding, 1
         )
+        if self.form_value:
+            self.form_value.width = self.max_width - self.field_width - Spacing.Padding
 
         return (self.max_width, self.value_para.height)
 
@@ -189,4 +195,37 @@ class ListRow(Flowable):
         self.field_para.drawOn(
             self.canv, 0, self.value_para.height - self.field_para.height
         )
-        self.value_para.drawOn(self.canv, self.field_width + Spacing.Padding, 0)
+        if self.form_value:
+            self.canv.saveState()
+            self.canv.translate(self.field_width + Spacing.Padding, 0)
+            self.canv.doForm(self.form_value.name)
+            self.canv.restoreState()
+        else:
+            self.value_para.drawOn(self.canv, self.field_width + Spacing.Padding, 0)
+
+
+class FormValue:
+    """
+    List value only known after the list is drawn, like a total of the rows
+    of a table below it. It takes a single line, drawn from a form that is
+    filled in once the value is known.
+    """
+
+    def __init__(self, name: str, placeholder: str = "0"):
+        self.name = name
+        self.placeholder = placeholder
+        self.width = 0.0
+
+    def __str__(self) -> str:
+        return self.placeholder
+
+    def fill(self, canvas: Canvas, text: str, style: ParagraphStyle):
+        canvas.beginForm(self.name)
+        canvas.setFont(style.fontName, style.fontSize)
+        canvas.setFillColor(style.textColor)
+        canvas.drawString(
+            0,
+            style.leading - style.fontSize,
+            fit_text(text, style.fontName, style.fontSize, self.width),
+        )
+        canvas.endForm()
@@ -0,0 +1,82 @@
+from reportlab.pdfbase.pdfmetrics import getFont, stringWidth
+from reportlab.pdfbase.ttfonts import TTFont
+
+from typing import Final, Iterable
+
+
+"""
+Text widths from cached font metrics, shared by everything that measures text.
+
+Glyph advances are read once per font, at size 1: the whole advance table of
+TrueType fonts like Poppins up front, other fonts one character at a time.
+Widths of whole texts are then kept in a process-wide cache keyed by text,
+font and size, since labels, headers and cell values are measured over and
+over from one layout to the next.
+"""
+
+
+# Texts whose widths are kept before starting over
+max_cached_widths: Final[int] = 16384
+
+_advances: dict[str, dict[str, float]] = {}
+_widths: dict[tuple[str, str, float], float] = {}
+
+
+def font_advances(font_name: str) -> dict[str, float]:
+    """Advances of the characters of a font at size 1, as far as known."""
+    if font_name not in _advances:
+        font = getFont(font_name)
+        advances = {}
+        if isinstance(font, TTFont):
+            advances = {
+                chr(code): width * 0.001 for code, width in font.face.charWidths.items()
+            }
+        _advances[font_name] = advances
+
+    return _advances[font_name]
+
+
+def char_advance(advances: dict[str, float], char: str, font_name: str) -> float:
+    """Advance of `char` in `advances`, the table of `font_name`."""
+    if char not in advances:
+        advances[char] = stringWidth(char, font_name, 1)
+    return advances[char]
+
+
+def text_width(text: str, font_name: str, font_size: float) -> float:
+    """Same as stringWidth, from the cached widths and advances."""
+    key = (text, font_name, font_size)
+    try:
+        return _widths[key]
+    except KeyError:
+        pass
+
+    advances = font_advances(font_name)
+    try:
+        width = sum(map(advances.__getitem__, text)) * font_size
+    except KeyError:
+        width = (
+            sum(char_advance(advances, char, font_name) for char in text) * font_size
+        )
+
+    if len(_widths) >= max_cached_widths:
+        _widths.clear()
+    _widths[key] = width
+
+    return width
+
+
+def text_widths(texts: Iterable[str], font_name: str, font_size: float) -> list[float]:
+    """
+    Widths of a batch of texts in one font and size. Every distinct text is
+    measured once, however many times it repeats in the batch.
+    """
+    measured: dict[str, float] = {}
+    widths = []
+
+    for text in texts:
+        if text not in measured:
+            measured[text] = text_width(text, font_name, font_size)
+        widths.append(measured[text])
+
+    return widths
@@ -1,15 +1,18 @@
-from reportlab.platypus import Flowable, Frame, Spacer, Paragraph
+from reportlab.platypus import Frame, Spacer
 from reportlab.graphics.shapes import Drawing, Polygon
 from reportlab.pdfgen.canvas import Canvas
 
 from reportlab.lib.units import mm
 
-from src.enums import Colors, Spacing
+from src.primitives.composite import CompositeFlowable
+from src.primitives.text import Text
+
+from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import ScoreData
 
 
-class ScoreChartPrimitive(Flowable):
+class ScoreChartPrimitive(CompositeFlowable):
 
     def __init__(self, score_data: ScoreData, debug_flag: int = 0):
         self.score_data = score_data
@@ -17,7 +20,7 @@ class ScoreChartPrimitive(Flowable):
 
         self.enforceRangeSort()
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -80,16 +83,19 @@ class ScoreChartPrimitive(Flowable):
 container_height = 20 * mm
 
 
-class _ScoreNumber(Flowable):
+class _ScoreNumber(CompositeFlowable):
 
     def __init__(
-        self, score_data: ScoreData, styles=CustomStyleSheet(), debug_flag: int = 0
+        self,
+        score_data: ScoreData,
+        styles=CustomStyleSheet.shared(),
+        debug_flag: int = 0,
     ):
         self.score_data = score_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -101,21 +107,15 @@ class _ScoreNumber(Flowable):
         canvas: Canvas = self.canv
 
         score_color = self.score_data.current_range.color
-        score_styles = self.styles.customStyle(
-            style=self.styles.Score_Center,
-            textColor=Colors.getTextColor(score_color).value,
-        )
+        score_styles = self.styles.textOn(self.styles.Score_Center, score_color)
         score_text = str(self.score_data.score)
 
         if not self.score_data.is_score_valid:
             score_color = self.score_data.not_valid_data.color
-            score_styles = self.styles.customStyle(
-                style=self.styles.Title_Center,
-                textColor=Colors.getTextColor(score_color).value,
-            )
+            score_styles = self.styles.textOn(self.styles.Title_Center, score_color)
             score_text = self.score_data.not_valid_data.aux_value
 
-        score_para = Paragraph(
+        score_para = Text(
             score_text,
             style=score_styles,
         )
@@ -162,7 +162,7 @@ class _ScoreNeedle(Drawing):
         self._showBoundary = debug_flag
 
 
-class _ScoreRanges(Flowable):
+class _ScoreRanges(CompositeFlowable):
 
     def __init__(
         self,
@@ -172,7 +172,7 @@ class _ScoreRanges(Flowable):
         self.score_data = score_data
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -246,12 +246,12 @@ class _ScoreRanges(Flowable):
         self.needle.drawOn(canvas, needle_x, needle_y)
 
 
-class _ScoreDescription(Flowable):
+class _ScoreDescription(CompositeFlowable):
 
     def __init__(
         self,
         score_data: ScoreData,
-        styles=CustomStyleSheet(),
+        styles=CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.score_data = score_data
@@ -261,18 +261,18 @@ class _ScoreDescription(Flowable):
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
         description_text = self.description
         if not self.score_data.is_score_valid:
             description_text = self.score_data.not_valid_data.description
-        self.description_para = Paragraph(
+        self.description_para = Text(
             description_text, style=self.styles.Caption_Bold_Center
         )
-        self.min_para = Paragraph(str(self.min), style=self.styles.Caption_70)
-        self.max_para = Paragraph(str(self.max), style=self.styles.Caption_70_Right)
+        self.min_para = Text(str(self.min), style=self.styles.Caption_70)
+        self.max_para = Text(str(self.max), style=self.styles.Caption_70_Right)
 
         self.description_para.wrapOn(self.canv, self.max_width, 1)
         self.min_para.wrapOn(self.canv, self.max_width, 1)
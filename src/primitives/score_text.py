@@ -1,25 +1,31 @@
-from reportlab.platypus import Flowable, Frame, Paragraph
+from reportlab.platypus import Frame
 from reportlab.pdfgen.canvas import Canvas
 
-from src.enums import Colors, Spacing
+from src.primitives.composite import CompositeFlowable
+from src.primitives.text import Text
+
+from src.enums import Spacing
 from src.styles.stylesheet import CustomStyleSheet
 from src.types.components import ScoreData
 
 
-class ScoreTextPrimitive(Flowable):
+class ScoreTextPrimitive(CompositeFlowable):
 
     def __init__(
-        self, score_data: ScoreData, styles=CustomStyleSheet(), debug_flag: int = 0
+        self,
+        score_data: ScoreData,
+        styles=CustomStyleSheet.shared(),
+        debug_flag: int = 0,
     ):
         self.score_data = score_data
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
-        self.aux_title_para = Paragraph(
+        self.aux_title_para = Text(
             text=self.score_data.aux_title,
             style=self.styles.Subtitle,
         )
@@ -37,7 +43,7 @@ class ScoreTextPrimitive(Flowable):
         if not self.score_data.is_score_valid:
             aux_description_text = self.score_data.not_valid_data.aux_template
 
-        self.aux_description_para = Paragraph(
+        self.aux_description_para = Text(
             text=aux_description_text,
             style=self.styles.Body,
         )
@@ -84,12 +90,12 @@ class ScoreTextPrimitive(Flowable):
         )
 
 
-class _AuxValue(Flowable):
+class _AuxValue(CompositeFlowable):
 
     def __init__(
         self,
         score_data: ScoreData,
-        styles=CustomStyleSheet(),
+        styles=CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.score_data = score_data
@@ -97,7 +103,7 @@ class _AuxValue(Flowable):
         self.styles = styles
         self.debug_flag = debug_flag
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
@@ -108,11 +114,10 @@ class _AuxValue(Flowable):
             aux_value_text = self.score_data.not_valid_data.aux_value
             self.aux_value_color = self.score_data.not_valid_data.color
 
-        aux_value_styles = self.styles.customStyle(
-            style=self.styles.Subtitle_Center,
-            textColor=Colors.getTextColor(self.aux_value_color).value,
+        aux_value_styles = self.styles.textOn(
+            self.styles.Subtitle_Center, self.aux_value_color
         )
-        self.aux_value_para = Paragraph(
+        self.aux_value_para = Text(
             text=aux_value_text,
             style=aux_value_styles,
         )
@@ -1,156 +1,669 @@
-from reportlab.platypus import Flowable, Paragraph, Frame, Table
+from reportlab.lib.colors import black
+from reportlab.platypus import Flowable, Table
 from reportlab.pdfgen.canvas import Canvas
-
-from src.primitives.list import ListPrimitive, ListData
+from reportlab.pdfgen.pathobject import PDFPathObject
+from reportlab.pdfgen.textobject import PDFTextObject
+
+from src.primitives.col_widths import (
+    estimate_col_widths,
+    cell_style,
+    cell_padding_x,
+    cell_padding_y,
+)
+from src.primitives.list import field_template, padding_x, padding_y, FormValue
+from src.primitives.metrics import text_width
+from src.primitives.text import Text, PlainText, is_plain, plain_text, text_extent
+from src.primitives.text_fit import fit_text
 
 from src.types.components import TableData
+from src.types.components.table import Row, GroupTotal
+from src.formatters import format_number
 from src.styles.stylesheet import CustomStyleSheet
 
 from src.enums import Spacing, Colors
 
+from math import ceil
+from typing import Final
+
+
+# Distinct cells and nested values a table keeps measured before starting over
+max_measured_values: Final[int] = 4096
+
+group_font: Final[str] = "Helvetica-Bold"
+
 
 class TablePrimitive(Flowable):
+    """
+    Lays the table out one page at a time: rows are pulled from
+    `TableData.rows` only until the available height is filled, and a split
+    hands the remaining rows over to a new TablePrimitive. Only about a page
+    of rows is ever held, whatever the size of the data.
+
+    Tables in the "fixed" row mode have rows of a single height, the rows of a
+    page are counted instead of measured and only built to be drawn.
+
+    Past `max_rows`, or on the last page `max_pages` and `max_bytes` allow,
+    the rows left are counted and summed up in a last row instead of drawn.
+    """
 
-    def __init__(self, table_data: TableData, styles=CustomStyleSheet(), debug_flag=0):
+    def __init__(
+        self,
+        table_data: TableData,
+        styles=CustomStyleSheet.shared(),
+        debug_flag=0,
+        first_row: int = 0,
+        overview_values: dict[str, FormValue] = {},
+    ):
         self.table_data = table_data
         self.styles = styles
         self.debug_flag = debug_flag
+        self.first_row = first_row
+        self.overview_values = overview_values
+
+        # Measured by the first wrap, then handed to the pages that follow
+        self.layout: _RowLayout
+        self.table_rows: dict[int, _TableRow] = {}
+        self.budget = _TableBudget(table_data.max_pages, table_data.max_bytes)
 
     def wrap(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
-        data = self.table_data.matrix
-        header, rows = _formatHeaders(data[0]), data[1:]
+        if not hasattr(self, "layout"):
+            self.layout = _RowLayout(
+                self.canv, self.table_data, self.max_width, self.styles
+            )
+
+        layout = self.layout
+        rows = self.table_data.rows
+
+        self.height = layout.header_height
+        self.fit_rows = 0
+        self.more_rows = 0
+        self.final = False
+
+        if layout.fixed:
+            fit_rows = self.rowsPerPage(self.max_height)
+            # One row past the page is enough to know a split is needed
+            rows_left = rows.available(self.first_row, fit_rows + 1)
+
+            self.fit_rows = min(rows_left, fit_rows)
+            self.height += rows_left * layout.fixed_row_height
+        else:
+            index = self.first_row
+            while rows.get(index) is not None:
+                self.height += self.tableRow(index).height + cell_padding_y
+                if self.height > self.max_height:
+                    # Reported taller than available, so the frame asks for a split
+                    break
+
+                self.fit_rows += 1
+                index += 1
+
+        next_row = self.first_row + self.fit_rows
+        overflow = rows.get(next_row) is not None
+        self.final = not overflow
+
+        if overflow and self.budget.lastPage():
+            # The last page the table may take, the rows left are only counted
+            self.height -= self.rowHeight(next_row)
+            while (
+                self.fit_rows and self.height + layout.summary_height > self.max_height
+            ):
+                self.fit_rows -= 1
+                next_row -= 1
+                self.height -= self.rowHeight(next_row)
+
+            self.final = True
+            self.leaveOut(next_row)
+        elif not overflow and next_row == rows.limit:
+            self.leaveOut(next_row)
 
-        temp_table = Table(data=[header, *rows])
+        return (self.max_width, self.height)
 
-        temp_table.wrapOn(self.canv, self.max_width, self.max_height)
+    def split(self, aW, aH):
+        self.wrap(aW, aH)
 
-        self.col_widths = temp_table._colWidths
+        if self.height <= self.max_height:
+            # Only when the rows left out make room for the summary row
+            return [self.makePage()]
 
-        del temp_table
+        if not self.fit_rows:
+            return []
 
-        complex_rows = (
-            [
-                _ComplexRow(
-                    row,
-                    table_data=self.table_data,
-                    col_widths=self.col_widths,
-                    row_index=i,
-                    styles=self.styles,
-                    debug_flag=self.debug_flag,
-                )
-            ]
-            for i, row in enumerate(rows)
+        next_row = self.first_row + self.fit_rows
+
+        rest = TablePrimitive(
+            self.table_data,
+            styles=self.styles,
+            debug_flag=self.debug_flag,
+            first_row=next_row,
+            overview_values=self.overview_values,
+        )
+        rest.layout = self.layout
+        rest.budget = self.budget
+        rest.table_rows = {
+            index: row for index, row in self.table_rows.items() if index >= next_row
+        }
+
+        page = self.makePage()
+
+        self.table_rows.clear()
+        self.table_data.rows.release(next_row)
+
+        return [page, rest]
+
+    def draw(self):
+        page = self.makePage()
+        page.wrapOn(self.canv, self.max_width, self.max_height)
+        page.drawOn(self.canv, 0, 0)
+
+    def makePage(self) -> "_TablePage":
+        indexes = range(self.first_row, self.first_row + self.fit_rows)
+
+        return _TablePage(
+            self.layout,
+            [self.tableRow(index) for index in indexes],
+            self.budget,
+            more_rows=self.more_rows,
+            overview_values=self.overview_values if self.final else {},
+            debug_flag=self.debug_flag,
         )
 
-        complex_data = [header, *complex_rows]
+    def tableRow(self, index: int) -> "_TableRow":
+        if index not in self.table_rows:
+            rows = self.table_data.rows
+            row = rows.get(index)
+            if row is None:
+                raise IndexError("Row %d is past the end of the table" % index)
+
+            group = None
+            if rows.totals is not None and self.table_data.group_by is not None:
+                # Reading the next row tells whether this one ends its group
+                rows.get(index + 1)
+                group = rows.totals.groups.get(index)
+
+            self.table_rows[index] = _TableRow(row, index, self.layout, group)
+
+        return self.table_rows[index]
+
+    def rowHeight(self, index: int) -> float:
+        if self.layout.fixed:
+            return self.layout.fixed_row_height
+        return self.table_rows[index].height + cell_padding_y
+
+    def leaveOut(self, index: int):
+        """Ends the table before `index`, with a row counting the rows left."""
+        rows = self.table_data.rows
+        if not rows.more(index):
+            return
+
+        self.height += self.layout.summary_height
+        # A summary row that does not fit goes to the next page on its own.
+        # The rows left are only counted once it is placed: counting reads an
+        # iterator to its end, and rows read that way can not be drawn later.
+        if self.height > self.max_height:
+            self.final = False
+            return
+
+        self.more_rows = rows.remaining(index)
+
+    def rowsPerPage(self, avail_height: float) -> int:
+        """Rows of the fixed row mode that fit in `avail_height`, header included."""
+        layout = self.layout
+        return max(
+            0, int((avail_height - layout.header_height) // layout.fixed_row_height)
+        )
 
-        self.table = Table(
-            complex_data,
-            colWidths=self.col_widths,
-            repeatRows=1,
+    def pageCount(
+        self, page_height: float, first_height: float | None = None
+    ) -> int | None:
+        """
+        Pages the rows left take in the fixed row mode, `first_height` being
+        the height left on the current page. None when the row count is not
+        known (iterators), before the first wrap, or if rows never fit.
+        """
+        count = self.table_data.rows.count()
+        if count is None or not hasattr(self, "layout") or not self.layout.fixed:
+            return None
+
+        remaining = count - self.first_row
+        first_rows = self.rowsPerPage(
+            first_height if first_height is not None else page_height
         )
+        if remaining <= first_rows:
+            return 1
 
-        self.table.wrapOn(self.canv, self.max_width, self.max_height)
+        page_rows = self.rowsPerPage(page_height)
+        if not page_rows:
+            return None
 
-        self.height = self.table._height
+        # A page where no row fits is skipped, the table starts on the next one
+        pages = 1 if first_rows else 0
+        return pages + ceil((remaining - first_rows) / page_rows)
 
-        return (self.max_width, self.height)
 
-    def split(self, aW, aH):
-        return self.table.split(aW, aH)
+class _TableBudget:
+    """
+    Pages a table has drawn and the bytes of page content its rows took (text
+    and backgrounds, before compression), against its limits.
+    """
 
-    def draw(self):
-        self.table.drawOn(self.canv, 0, 0)
+    def __init__(self, max_pages: int | None, max_bytes: int | None):
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.pages = 0
+        self.bytes = 0
+
+    def lastPage(self) -> bool:
+        """Whether the next page has to be the last one to stay in the limits."""
+        if self.max_pages is not None and self.pages + 1 >= self.max_pages:
+            return True
+
+        if self.max_bytes is not None and self.pages:
+            # The next page is expected to take as much as the average one
+            return self.bytes + self.bytes / self.pages >= self.max_bytes
 
+        return False
 
-def _ColHeader(text: str, styles=CustomStyleSheet()):
-    return Paragraph(text, styles.Subtitle)
+    def record(self, size: int):
+        self.pages += 1
+        self.bytes += size
 
 
-def _formatHeaders(row: list):
-    return [_ColHeader(cell) for cell in row]
+def _ColHeader(text: str, styles=CustomStyleSheet.shared()):
+    return Text(text, styles.Subtitle)
 
 
-class _ComplexRow(Flowable):
+def _formatHeaders(row: list, styles=CustomStyleSheet.shared()):
+    return [_ColHeader(cell, styles) for cell in row]
+
+
+class _RowLayout:
+    """
+    Everything the rows of a table have in common: column positions, fonts,
+    the header and the nested field labels, measured once per table.
+    """
 
     def __init__(
         self,
-        row,
+        canvas: Canvas,
         table_data: TableData,
-        col_widths,
-        row_index,
-        styles=CustomStyleSheet(),
-        debug_flag=0,
+        avail_width: float,
+        styles: CustomStyleSheet,
     ):
-        self.row = row
         self.table_data = table_data
-        self.col_widths = col_widths
-        self.row_index = row_index
-        self.styles = styles
-        self.debug_flag = debug_flag
+        self.fixed = table_data.row_mode == "fixed"
+
+        self.header = _formatHeaders(table_data.header, styles)
+        self.col_widths = estimate_col_widths(table_data, self.header, avail_width)
+        self.width = sum(self.col_widths)
+
+        self.header_table = Table(data=[self.header], colWidths=self.col_widths)
+        self.header_table.wrapOn(canvas, avail_width, 1)
+        self.header_height = self.header_table._height
+
+        # Cells are drawn as plain table cells, offset like the one-row Table
+        # the rows used to be made of.
+        cells_x = -Spacing.Gap / 2 + cell_style.leftPadding
+        self.cell_xs = []
+        for col_width in self.col_widths:
+            self.cell_xs.append(cells_x)
+            cells_x += col_width
+
+        self.text_widths = [col_width - cell_padding_x for col_width in self.col_widths]
+
+        self.value_style = styles.Body
+        self.label_style = styles.Body_Bold_Right
+
+        self.fields = list(table_data.nested_fields.items())
+        self.nested_x = Spacing.Gap
+        self.nested_width = self.width - Spacing.Gap * 3
+
+        self.label_widths = [0.0, 0.0]
+        for index, (_, field) in enumerate(self.fields):
+            side = index % 2
+            self.label_widths[side] = max(
+                self.label_widths[side],
+                text_extent(
+                    field_template % field, self.label_style, self.nested_width
+                ),
+            )
 
-    def wrap(self, aW, aH):
-        self.max_width = sum(self.col_widths)
-        self.max_height = aH
+        # Labels are the same on every row: single line ones are drawn as
+        # text, right aligned like the Paragraph would be.
+        self.labels: list[tuple[str | Flowable, float, float]] = []
+        for index, (_, field) in enumerate(self.fields):
+            paragraph = Text(field_template % field, self.label_style)
+            paragraph.wrapOn(canvas, self.label_widths[index % 2], 1)
+
+            if isinstance(paragraph, PlainText) and len(paragraph.lines) == 1:
+                label: str | Flowable = paragraph.lines[0][0]
+            else:
+                label = paragraph
+            self.labels.append((label, paragraph._width_max, paragraph.height))
+
+        column_width = self.nested_width / 2 - padding_x * 2
+        self.value_widths = [
+            column_width - label_width - Spacing.Padding
+            for label_width in self.label_widths
+        ]
+        self.spacers_height = (
+            ceil(max(1, len(self.fields) / 2 - 1)) * Spacing.Padding
+            if self.fields
+            else 0
+        )
+
+        if self.fixed:
+            # Values are a single line, entries take that line or their label
+            side_heights = [self.spacers_height, self.spacers_height]
+            for index, (_, _, label_height) in enumerate(self.labels):
+                side_heights[index % 2] += max(self.value_style.leading, label_height)
 
-        self.story: list[Flowable] = []
+            nested_height = max(side_heights) + padding_y * 2 if self.fields else 0
+            self.fixed_row_height = (
+                cell_style.leading + cell_padding_y * 2 + nested_height
+            )
+
+        self.summary_height = cell_style.leading + cell_padding_y * 2
+        self.more_rows_template = table_data.more_rows_template
+        self.group_template = table_data.group_template
+
+        self.fitted_cells: dict[tuple[str, int], list[str]] = {}
+        self.measured_values: dict[tuple[str, int], tuple[str | Flowable, float]] = {}
 
-        self.table = Table(
-            data=[self.row],
-            colWidths=self.col_widths,
+    def groupLine(self, group: GroupTotal) -> str:
+        line = self.group_template % (group.key, format_number(group.count))
+        for label, aggregate in self.table_data.subtotals.items():
+            line += "; %s: %s" % (label, aggregate.format(group.values[label]))
+
+        return fit_text(
+            line, group_font, cell_style.fontsize, self.width - cell_padding_x
         )
-        self.table.wrapOn(self.canv, self.max_width - Spacing.Gap, self.max_height)
 
-        self.height = self.table._height
+    def cellLines(self, col: int, cell) -> list[str]:
+        text = str(cell) if cell is not None else ""
+        if not self.fixed:
+            return text.split("\n")
+
+        key = (text, col)
+        if key not in self.fitted_cells:
+            if len(self.fitted_cells) >= max_measured_values:
+                self.fitted_cells.clear()
+            self.fitted_cells[key] = [
+                fit_text(
+                    " ".join(text.split()),
+                    cell_style.fontname,
+                    cell_style.fontsize,
+                    self.text_widths[col],
+                )
+            ]
 
-        self.story.append(self.table)
+        return self.fitted_cells[key]
+
+    def measureValue(self, text: str, side: int) -> tuple[str | Flowable, float]:
+        """
+        Nested values repeat from row to row (statuses, dates...), so each
+        distinct value is measured once per side of the nested list.
+        """
+        key = (text, side)
+        if key not in self.measured_values:
+            if len(self.measured_values) >= max_measured_values:
+                self.measured_values.clear()
+            if self.fixed:
+                self.measured_values[key] = _fitValue(
+                    text, self.value_style, self.value_widths[side]
+                )
+            else:
+                self.measured_values[key] = _measureValue(
+                    text, self.value_style, self.value_widths[side]
+                )
 
-        if self.table_data.nested_fields:
-            self.list_primitive = ListPrimitive(
-                ListData(
-                    items=self.table_data.data[self.row_index],
-                    fields=self.table_data.nested_fields,
-                ),
-                styles=self.styles,
-                debug_flag=self.debug_flag,
+        return self.measured_values[key]
+
+
+class _TableRow:
+    """
+    A data row measured once and drawn straight to the canvas. Text is kept
+    as plain strings; only nested values with markup or that wrap are kept
+    as flowables.
+    """
+
+    __slots__ = (
+        "row_index",
+        "cells",
+        "cells_height",
+        "values",
+        "entry_heights",
+        "nested_height",
+        "group_line",
+        "footer_height",
+        "height",
+    )
+
+    def __init__(
+        self,
+        row: Row,
+        row_index: int,
+        layout: _RowLayout,
+        group: GroupTotal | None = None,
+    ):
+        self.row_index = row_index
+
+        self.cells = [
+            layout.cellLines(col, cell)
+            for col, cell in enumerate(layout.table_data.cells(row))
+        ]
+        self.cells_height = (
+            max((len(lines) for lines in self.cells), default=1) * cell_style.leading
+            + cell_padding_y
+        )
+
+        self.values: list[str | Flowable] = []
+        self.entry_heights: list[float] = []
+        side_heights: list[float] = [layout.spacers_height, layout.spacers_height]
+
+        for index, (key, _) in enumerate(layout.fields):
+            value = layout.table_data.formatted(key, row.get(key, ""))
+            value, height = layout.measureValue(str(value), index % 2)
+            # An empty value still takes the height of its label
+            height = max(height, layout.labels[index][2])
+
+            self.values.append(value)
+            self.entry_heights.append(height)
+            side_heights[index % 2] += height
+
+        self.nested_height = max(side_heights) + padding_y * 2 if layout.fields else 0
+
+        # The last row of a group carries the subtotal row under it
+        self.group_line = layout.groupLine(group) if group else ""
+        self.footer_height = layout.summary_height if group else 0
+
+        self.height = self.cells_height + self.nested_height + self.footer_height
+
+    def drawBackground(
+        self, path: PDFPathObject, x: float, y: float, layout: _RowLayout
+    ):
+        if self.row_index % 2 == 0:
+            path.rect(
+                x - Spacing.Padding / 2,
+                y + self.footer_height - Spacing.Padding / 2,
+                layout.width - Spacing.Padding,
+                self.height - self.footer_height + Spacing.Padding,
             )
-            self.list_primitive.wrapOn(
-                self.canv, self.max_width - Spacing.Gap, self.max_height
+
+    def drawText(
+        self, text: PDFTextObject, x: float, y: float, layout: _RowLayout
+    ) -> list[tuple[Flowable, float, float]]:
+        """
+        Writes the plain text of the row to `text` and returns the flowables
+        left to draw, with their positions.
+        """
+        text.setFont(cell_style.fontname, cell_style.fontsize, cell_style.leading)
+
+        cells_y = y + self.height - self.cells_height + cell_style.bottomPadding
+        for cell_x, lines in zip(layout.cell_xs, self.cells):
+            line_y = cells_y + len(lines) * cell_style.leading - cell_style.fontsize
+            for line in lines:
+                text.setTextOrigin(x + cell_x, line_y)
+                text.textOut(line)
+                line_y -= cell_style.leading
+
+        paragraphs = []
+
+        label_style = layout.label_style
+        value_style = layout.value_style
+
+        top = y + self.footer_height + self.nested_height - padding_y
+        tops = [top, top]
+        for index, (label, label_width, label_height) in enumerate(layout.labels):
+            side = index % 2
+            column_x = x + layout.nested_x + side * layout.nested_width / 2 + padding_x
+
+            entry_top = tops[side]
+            tops[side] -= self.entry_heights[index] + Spacing.Padding
+
+            # Each label right before its value, so that text extracted from
+            # the page reads as "label: value" pairs
+            if isinstance(label, Flowable):
+                paragraphs.append((label, column_x, entry_top - label_height))
+            else:
+                text.setFont(
+                    label_style.fontName, label_style.fontSize, label_style.leading
+                )
+                text.setTextOrigin(
+                    column_x + layout.label_widths[side] - label_width,
+                    entry_top - label_style.fontSize,
+                )
+                text.textOut(label)
+
+            value = self.values[index]
+            value_x = column_x + layout.label_widths[side] + Spacing.Padding
+            if isinstance(value, Flowable):
+                paragraphs.append((value, value_x, entry_top - value.height))
+            elif value:
+                text.setFont(
+                    value_style.fontName, value_style.fontSize, value_style.leading
+                )
+                text.setTextOrigin(value_x, entry_top - value_style.fontSize)
+                text.textOut(value)
+
+        if self.group_line:
+            text.setFont(group_font, cell_style.fontsize, cell_style.leading)
+            text.setTextOrigin(
+                x + layout.cell_xs[0],
+                y + cell_style.bottomPadding + cell_style.leading - cell_style.fontsize,
             )
+            text.textOut(self.group_line)
 
-            self.height += self.list_primitive.height
+        return paragraphs
 
-            self.story.append(self.list_primitive)
 
-        return (self.max_width, self.height)
+def _measureValue(text: str, style, width: float) -> tuple[str | Flowable, float]:
+    if is_plain(text):
+        line = " ".join(text.split())
+        if not line:
+            return ("", 0)
+        if text_width(line, style.fontName, style.fontSize) <= width:
+            return (line, style.leading)
+
+    paragraph = Text(text, style)
+    _, height = paragraph.wrap(width, 1)
+    return (paragraph, height)
+
+
+def _fitValue(text: str, style, width: float) -> tuple[str, float]:
+    # Values are drawn as text in the fixed row mode, without their markup
+    line = " ".join(plain_text(text, style).split())
+    return (fit_text(line, style.fontName, style.fontSize, width), style.leading)
+
+
+class _TablePage(Flowable):
+    """The header and the rows of one page of a table."""
+
+    def __init__(
+        self,
+        layout: _RowLayout,
+        rows: list[_TableRow],
+        budget: _TableBudget,
+        more_rows: int = 0,
+        overview_values: dict[str, FormValue] = {},
+        debug_flag: int = 0,
+    ):
+        self.layout = layout
+        self.rows = rows
+        self.budget = budget
+        self.more_rows = more_rows
+        self.overview_values = overview_values
+        self.debug_flag = debug_flag
+        self.hAlign = "CENTER"
+
+    def wrap(self, aW, aH):
+        self.width = self.layout.width
+        self.height = self.layout.header_height + sum(
+            row.height + cell_padding_y for row in self.rows
+        )
+        if self.more_rows:
+            self.height += self.layout.summary_height
+
+        return (self.width, self.height)
 
     def draw(self):
         canvas: Canvas = self.canv
+        layout = self.layout
 
-        frame = Frame(
-            x1=0,
-            y1=0,
-            width=self.max_width - Spacing.Gap,
-            height=self.height,
-            topPadding=0,
-            bottomPadding=0,
-            rightPadding=Spacing.Gap,
-            leftPadding=Spacing.Gap,
-            showBoundary=self.debug_flag,
-        )
+        layout.header_table.drawOn(canvas, 0, self.height - layout.header_height)
 
-        if self.row_index % 2 == 0:
-            canvas.setFillColor(Colors.Gray.value)
-            canvas.setStrokeAlpha(0)
-            canvas.rect(
-                x=-Spacing.Padding / 2,
-                y=-Spacing.Padding / 2,
-                width=self.max_width - Spacing.Padding,
-                height=self.height + Spacing.Padding,
-                fill=1,
+        positions = []
+        y = self.height - layout.header_height
+        for row in self.rows:
+            y -= row.height + cell_padding_y
+            positions.append(
+                (row, cell_style.leftPadding, y + cell_style.bottomPadding)
             )
 
-        frame.addFromList(self.story, canvas)
+        # The backgrounds of the page are a single path, filled at once
+        path = canvas.beginPath()
+        for row, x, y in positions:
+            row.drawBackground(path, x, y, layout)
+
+        canvas.saveState()
+        canvas.setFillColor(Colors.Gray.value)
+        canvas.drawPath(path, stroke=0, fill=1)
+
+        if self.debug_flag:
+            for row, x, y in positions:
+                canvas.rect(x, y, layout.width - Spacing.Gap, row.height)
+        canvas.restoreState()
+
+        # All the plain text of the page goes into a single text object
+        text = canvas.beginText()
+        text.setFillColor(black)
+        paragraphs = []
+        for row, x, y in positions:
+            paragraphs += row.drawText(text, x, y, layout)
+
+        if self.more_rows:
+            text.setFont(cell_style.fontname, cell_style.fontsize, cell_style.leading)
+            text.setTextOrigin(
+                cell_style.leftPadding + layout.cell_xs[0],
+                cell_padding_y + cell_style.leading - cell_style.fontsize,
+            )
+            text.textOut(layout.more_rows_template % format_number(self.more_rows))
+        canvas.drawText(text)
+
+        for paragraph, x, y in paragraphs:
+            paragraph.drawOn(canvas, x, y)
+
+        self.budget.record(len(path.getCode()) + len(text.getCode()))
+
+        # Last page: every row has been read, the overview totals are known
+        totals = layout.table_data.totals
+        if totals is None:
+            return
+
+        for label, form_value in self.overview_values.items():
+            aggregate = layout.table_data.aggregates[label]
+            form_value.fill(
+                canvas, aggregate.format(totals.values[label]), layout.value_style
+            )
@@ -0,0 +1,240 @@
+from reportlab.lib.colors import Color
+from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.platypus import Flowable, Paragraph
+from reportlab.pdfgen.canvas import Canvas
+
+from src.primitives.metrics import text_width
+
+from functools import lru_cache
+from typing import Final
+
+
+"""
+Text without markup drawn straight to the canvas.
+
+Most of the text in a report is plain: labels, headers, values. A Paragraph
+runs every one of them through its markup parser, `Text` only hands the ones
+with markup, or a style a Paragraph is needed for, to a Paragraph. The others
+are measured from cached glyph advances and drawn with drawString and its right
+and centred variants, broken into lines only when they do not fit.
+
+The same texts are laid out again and again (labels on every row, levels on
+every card), so the fragments Paragraphs are parsed into and the lines plain
+texts are broken into are kept in LRU caches, keyed by text and style and, for
+lines, width. `text_cache_info()` tells how well they hit.
+"""
+
+
+# What a Paragraph would read as markup, an entity or a special space. A zero
+# width space is where a Paragraph may break a line, even inside a word.
+markup_chars: Final = ("<", "&", "\xa0", "\xad", "\u200b")
+
+alignments: Final = (TA_LEFT, TA_CENTER, TA_RIGHT)
+
+# Distinct texts each cache keeps, the least recently used are dropped first
+max_cached_texts: Final[int] = 4096
+
+
+def is_plain(text: str) -> bool:
+    for char in markup_chars:
+        if char in text:
+            return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def is_simple(style: ParagraphStyle) -> bool:
+    """Whether a style only sets what PlainText draws: font, color, alignment."""
+    return (
+        style.alignment in alignments
+        and not style.firstLineIndent
+        and not style.backColor
+        and not (style.borderWidth and style.borderColor)
+        and not style.wordWrap
+        and not style.textTransform
+        and not style.endDots
+        and not style.shaping
+        and not style.hyphenationLang
+        and not style.uriWasteReduce
+        and not style.embeddedHyphenation
+        and getattr(style, "autoLeading", "") in ("", "off", None)
+    )
+
+
+def Text(text: str, style: ParagraphStyle) -> Flowable:
+    """A PlainText when `text` has no markup, a Paragraph otherwise."""
+    if is_plain(text) and is_simple(style):
+        return PlainText(text, style)
+
+    style, frags, bullet_text = _parse(text, style)
+    return Paragraph(text, style, bullet_text, frags=frags)
+
+
+def text_extent(text: str, style: ParagraphStyle, width: float) -> float:
+    """
+    Width of the widest line of `text` laid out in `width`, the `_width_max`
+    of its flowable, without making one for plain text that fits on a line.
+    """
+    if is_plain(text) and is_simple(style):
+        line = " ".join(text.split())
+        line_width = text_width(line, style.fontName, style.fontSize)
+        if line_width <= width - style.leftIndent - style.rightIndent:
+            return line_width
+
+    flowable = Text(text, style)
+    flowable.wrap(width, 1)
+    return flowable._width_max
+
+
+def plain_text(text: str, style: ParagraphStyle) -> str:
+    """
+    `text` as a Paragraph would show it on a single line: entities read, tags
+    and soft breaks dropped, line breaks as spaces.
+    """
+    if is_plain(text):
+        return text
+
+    _, frags, _ = _parse(text, style)
+    line = "".join(
+        " " if getattr(frag, "lineBreak", False) else frag.text for frag in frags
+    )
+    return line.replace("\xad", "").replace("\u200b", "")
+
+
+def text_cache_info() -> dict:
+    """Hits, misses and sizes of the fragment and line caches."""
+    return {"fragments": _parse.cache_info(), "lines": _breakLines.cache_info()}
+
+
+@lru_cache(maxsize=max_cached_texts)
+def _parse(text: str, style: ParagraphStyle) -> tuple:
+    # The style and bullet text, markup may change them, and the fragments
+    paragraph = Paragraph(text, style)
+    return (paragraph.style, paragraph.frags, paragraph.bulletText)
+
+
+class PlainText(Flowable):
+    """
+    Text laid out like a Paragraph of the same style: lines broken between
+    words, as tall as their leading, with the first baseline a font size
+    below the top. It has the same `_width_max`, `minWidth()` and spacing.
+
+    A word wider than the whole width is split by a Paragraph, the text is
+    then handed over to one.
+    """
+
+    def __init__(self, text: str, style: ParagraphStyle):
+        self.text = text
+        self.style = style
+        self.lines: tuple[tuple[str, float], ...] = ()
+        self.paragraph: Paragraph | None = None
+        self.debug = 0
+
+    def wrap(self, aW, aH):
+        style = self.style
+        self.width = aW
+        self.line_width = aW - style.leftIndent - style.rightIndent
+        self.paragraph = None
+
+        lines = _breakLines(self.text, style, self.line_width)
+        if lines is None:
+            self.lines = ()
+            self.paragraph = Paragraph(self.text, style)
+            _, self.height = self.paragraph.wrap(aW, aH)
+            self._width_max = self.paragraph._width_max
+            return (aW, self.height)
+
+        self.lines = lines
+        self.height = len(self.lines) * style.leading
+        self._width_max = max((width for _, width in self.lines), default=0)
+
+        return (aW, self.height)
+
+    def minWidth(self):
+        style = self.style
+        return max(
+            (
+                text_width(word, style.fontName, style.fontSize)
+                for word in self.text.split()
+            ),
+            default=0,
+        )
+
+    def draw(self):
+        if self.paragraph:
+            self.paragraph.debug = self.debug
+            self.paragraph.drawOn(self.canv, 0, 0)
+            return
+
+        canvas: Canvas = self.canv
+        style = self.style
+        left = style.leftIndent
+
+        if self.debug:
+            _drawDebugBox(canvas, left, self.line_width, self.height)
+
+        canvas.setFont(style.fontName, style.fontSize)
+        canvas.setFillColor(style.textColor)
+
+        y = self.height - style.fontSize
+        for line, width in self.lines:
+            extra_space = self.line_width - width
+            spaces = line.count(" ")
+
+            if extra_space < -1e-8 and spaces:
+                # Shrunk spaces, the line takes the whole width
+                canvas.drawString(left, y, line, wordSpace=extra_space / spaces)
+            elif style.alignment == TA_RIGHT:
+                canvas.drawRightString(left + self.line_width, y, line)
+            elif style.alignment == TA_CENTER:
+                canvas.drawCentredString(left + self.line_width / 2, y, line)
+            else:
+                canvas.drawString(left, y, line)
+
+            y -= style.leading
+
+
+@lru_cache(maxsize=max_cached_texts)
+def _breakLines(
+    text: str, style: ParagraphStyle, max_width: float
+) -> tuple[tuple[str, float], ...] | None:
+    """Lines and their widths, None when a word does not fit on a line."""
+    font_name = style.fontName
+    font_size = style.fontSize
+
+    space_width = text_width(" ", font_name, font_size)
+    # A Paragraph lets the spaces of a line shrink a little to fit a word
+    space_shrink = style.spaceShrinkage * space_width
+
+    lines = []
+    line: list[str] = []
+    line_width = -space_width
+    for word in text.split():
+        word_width = text_width(word, font_name, font_size)
+        if word_width > max_width:
+            return None
+
+        new_width = line_width + space_width + word_width
+        if new_width <= max_width + space_shrink * len(line) or not line:
+            line.append(word)
+            line_width = new_width
+        else:
+            lines.append((" ".join(line), line_width))
+            line = [word]
+            line_width = word_width
+
+    if line:
+        lines.append((" ".join(line), line_width))
+
+    return tuple(lines)
+
+
+def _drawDebugBox(canvas: Canvas, x: float, width: float, height: float):
+    # The box a Paragraph draws around itself in debug mode
+    canvas.saveState()
+    canvas.setStrokeColor(Color(1, 1, 0))
+    canvas.setFillColor(Color(0.9, 0.9, 0.9))
+    canvas.setLineWidth(0.5)
+    canvas.rect(x, 0, width, height, stroke=1, fill=1)
+    canvas.restoreState()
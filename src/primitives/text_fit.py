@@ -0,0 +1,42 @@
+from src.primitives.metrics import char_advance, font_advances
+
+from typing import Final
+
+
+"""
+Single line text fitted to a width from cached glyph advances.
+
+The advance of every character is measured once per font, at size 1, so fitting
+a text is a running sum over its characters instead of a stringWidth call per
+candidate length.
+"""
+
+
+ellipsis: Final[str] = "…"
+
+
+def fit_text(text: str, font_name: str, font_size: float, width: float) -> str:
+    """
+    `text` as it is when it fits in `width`, otherwise cut where the text
+    followed by an ellipsis still fits.
+    """
+    advances = font_advances(font_name)
+
+    limit = width / font_size
+    cut_limit = limit - char_advance(advances, ellipsis, font_name)
+
+    total = 0.0
+    cut = 0
+    for index, char in enumerate(text):
+        total += char_advance(advances, char, font_name)
+        if total <= cut_limit:
+            cut = index + 1
+        elif total > limit:
+            break
+    else:
+        return text
+
+    if cut_limit < 0:
+        return ""
+
+    return text[:cut].rstrip() + ellipsis
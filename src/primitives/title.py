@@ -1,16 +1,19 @@
-from reportlab.platypus import Flowable, Paragraph
+from reportlab.platypus import Flowable
 from reportlab.pdfgen.canvas import Canvas
 
+from src.primitives.composite import CompositeFlowable
+from src.primitives.text import Text
+
 from src.enums import Colors, Spacing
 from src.styles.stylesheet import CustomStyleSheet
 
 
-class TitlePrimitive(Flowable):
+class TitlePrimitive(CompositeFlowable):
 
     def __init__(
         self,
         title: str,
-        styles: CustomStyleSheet = CustomStyleSheet(),
+        styles: CustomStyleSheet = CustomStyleSheet.shared(),
         debug_flag: int = 0,
     ):
         self.title = title
@@ -18,11 +21,11 @@ class TitlePrimitive(Flowable):
         self.debug_flag = debug_flag
         self.height = 0
 
-    def wrap(self, aW, aH):
+    def layout(self, aW, aH):
         self.max_width = aW
         self.max_height = aH
 
-        self.para = Paragraph(self.title, self.styles.Title)
+        self.para = Text(self.title, self.styles.Title)
         self.para.wrapOn(self.canv, self.max_width, 1)
 
         self.height = self.para.height
@@ -0,0 +1,270 @@
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from socketserver import ThreadingMixIn, UnixStreamServer
+
+from src.pdf_builder import PDFBuilder
+from src.primitives.icon import loadIcons
+from src.report_json import ReportError, builder_from_json
+from src.styles.fonts import register_fonts
+
+from collections import deque
+from typing import Any
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+
+"""
+Resident render service.
+
+Fonts, the stylesheet and the parsed icons are loaded once at startup, report
+jobs are queued for a fixed set of render threads and the PDF bytes are sent
+back over HTTP, either on localhost or on a Unix socket:
+
+    python -m src.render_daemon --port 8765
+    python -m src.render_daemon --unix /tmp/render.sock
+
+    POST /render   report JSON (see src.report_json) -> application/pdf
+    GET  /stats    queue depth, counters and latency percentiles
+
+Reports are checked before they are queued, invalid ones are answered with
+400 and reports that fail to render with 500. When the queue is full new jobs
+are rejected right away with 503 and a Retry-After header instead of piling
+up.
+"""
+
+
+class _RenderJob:
+
+    def __init__(self, builder: PDFBuilder):
+        self.builder = builder
+        self.future: Future[bytes] = Future()
+        self.queued_at = time.perf_counter()
+
+
+class RenderQueue:
+
+    def __init__(
+        self, workers: int = 2, max_queue: int = 64, latency_window: int = 1000
+    ):
+        self.workers = workers
+        self.max_queue = max_queue
+
+        self.jobs: queue.Queue[_RenderJob | None] = queue.Queue(maxsize=max_queue)
+
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self.wait_times: deque[float] = deque(maxlen=latency_window)
+        self.render_times: deque[float] = deque(maxlen=latency_window)
+
+        self.threads = [
+            threading.Thread(target=self._work, name="render-%d" % i, daemon=True)
+            for i in range(workers)
+        ]
+
+    def start(self):
+        register_fonts()
+        loadIcons()
+
+        for thread in self.threads:
+            thread.start()
+
+    def stop(self):
+        for _ in self.threads:
+            self.jobs.put(None)
+        for thread in self.threads:
+            thread.join()
+
+    def submit(self, builder: PDFBuilder) -> "Future[bytes] | None":
+        job = _RenderJob(builder)
+        try:
+            self.jobs.put_nowait(job)
+        except queue.Full:
+            with self.lock:
+                self.rejected += 1
+            return None
+        return job.future
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "queue_depth": self.jobs.qsize(),
+                "queue_capacity": self.max_queue,
+                "workers": self.workers,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "wait_ms": _percentiles(self.wait_times),
+                "render_ms": _percentiles(self.render_times),
+            }
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+
+            started_at = time.perf_counter()
+            with self.lock:
+                self.in_flight += 1
+                self.wait_times.append(started_at - job.queued_at)
+
+            try:
+                job.future.set_result(job.builder.build_bytes())
+                failed = 0
+            except Exception as error:
+                job.future.set_exception(error)
+                failed = 1
+
+            with self.lock:
+                self.in_flight -= 1
+                self.completed += 1 - failed
+                self.failed += failed
+                self.render_times.append(time.perf_counter() - started_at)
+
+
+def _percentiles(samples: deque[float]) -> dict[str, float]:
+    if not samples:
+        return {"count": 0, "p50": 0, "p95": 0, "p99": 0, "max": 0}
+
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return round(
+            ordered[min(len(ordered) - 1, int(len(ordered) * fraction))] * 1000, 2
+        )
+
+    return {
+        "count": len(ordered),
+        "p50": at(0.5),
+        "p95": at(0.95),
+        "p99": at(0.99),
+        "max": round(ordered[-1] * 1000, 2),
+    }
+
+
+class _RenderRequestHandler(BaseHTTPRequestHandler):
+    server: "_RenderServer"  # type: ignore
+
+    def do_GET(self):
+        if self.path != "/stats":
+            return self.send_error(404)
+
+        self._send(
+            200,
+            "application/json",
+            json.dumps(self.server.render_queue.stats()).encode(),
+        )
+
+    def do_POST(self):
+        if self.path != "/render":
+            return self.send_error(404)
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            report = json.loads(self.rfile.read(length))
+        except ValueError as error:
+            return self.send_error(400, "Invalid JSON: %s" % error)
+
+        try:
+            builder = builder_from_json(report)
+        except ReportError as error:
+            return self.send_error(400, "Invalid report: %s" % error)
+
+        future = self.server.render_queue.submit(builder)
+        if future is None:
+            self.send_response(503, "Render queue is full")
+            self.send_header("Retry-After", "1")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        try:
+            pdf = future.result()
+        except Exception as error:
+            return self.send_error(500, "Render failed: %r" % error)
+
+        self._send(200, "application/pdf", pdf)
+
+    def _send(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return str(self.client_address[0]) if self.client_address else "unix"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _RenderServer:
+    render_queue: RenderQueue
+    verbose: bool
+
+
+class _TCPRenderServer(_RenderServer, ThreadingHTTPServer):
+    pass
+
+
+class _UnixRenderServer(_RenderServer, ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: str | None = None,
+    workers: int = 2,
+    max_queue: int = 64,
+    verbose: bool = False,
+):
+    render_queue = RenderQueue(workers=workers, max_queue=max_queue)
+    render_queue.start()
+
+    server: _UnixRenderServer | _TCPRenderServer
+    if unix_socket:
+        if os.path.exists(unix_socket):
+            os.unlink(unix_socket)
+        server = _UnixRenderServer(unix_socket, _RenderRequestHandler)
+    else:
+        server = _TCPRenderServer((host, port), _RenderRequestHandler)
+
+    server.render_queue = render_queue
+    server.verbose = verbose
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        render_queue.stop()
+
+        if unix_socket:
+            os.unlink(unix_socket)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Resident PDF render service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", dest="unix_socket", default=None)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--verbose", action="store_true")
+
+    try:
+        serve(**vars(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,288 @@
+from reportlab.platypus import Flowable
+
+from src.pdf_builder import PDFBuilder
+
+from src.components.header import HeaderData
+from src.components.list import List
+from src.components.icon_card_list import IconCardList
+from src.components.score import Score
+from src.components.gauge_card_list import GaugeCardList
+from src.components.table import Table
+
+from src.enums import Colors, SvgPath
+from src.formatters import (
+    Formatter,
+    Number,
+    Currency,
+    Mask,
+    Date,
+    Percent,
+    CPF,
+    CNPJ,
+    CEP,
+)
+
+from src.types.components import (
+    ListData,
+    ListField,
+    IconCardData,
+    ScoreData,
+    ScoreRangeData,
+    ScoreNotValidData,
+    GaugeCardListData,
+    GaugeCardGroupData,
+    GaugeCardData,
+    TableData,
+    TableColumn,
+    Aggregate,
+    Count,
+    Sum,
+)
+
+from typing import Any, Callable
+
+
+"""
+Builds a report from plain JSON data, the format accepted by the render daemon:
+
+{
+    "header": {"category_name": "...", "product_name": "...", ...},
+    "components": [
+        {"type": "list", "title": "...", "fields": {...}, "items": {...}},
+        {"type": "icon_card_list", "title": "...", "items": [
+            {"title": "...", "description": "...", "icon": "Warning", "color": "Orange"}
+        ]},
+        {"type": "score", "title": "...", "score": 950, "min_score": 300,
+            "aux_title": "...", "aux_template": "...",
+            "not_valid": {"color": "Gray", "aux_template": "...", "description": "...", "aux_value": "..."},
+            "ranges": [{"max_score": 400, "color": "Red", "description": "...", "aux_value": "..."}]},
+        {"type": "gauge_card_list", "title": "...", "groups": [
+            {"title": "...", "cards": [
+                {"title": "...", "description": "...", "level": 1, "level_text": "...", "color": "Green"}
+            ]}
+        ]},
+        {"type": "table", "title": "...", "columns": {...}, "data": [{...}],
+            "nested_fields": {...}, "overview": {...}, "row_mode": "wrap",
+            "max_rows": 1000, "max_pages": 50, "max_bytes": 5000000, "count_label": "...",
+            "aggregates": {"...": {"type": "count", "where": {"status": "..."}}},
+            "group_by": "...", "subtotals": {"...": {"type": "sum", "key": "..."}}}
+    ]
+}
+
+Colors and icons are given by their enum member names. Columns and fields are
+plain titles or {"title": "...", "format": {"type": "currency", "cents": true}},
+with the formatters of src.formatters: number, currency, mask ("cpf", "cnpj",
+"cep" or a "#" pattern), date and percent.
+"""
+
+
+class ReportError(ValueError):
+    """The JSON does not describe a report: a field is missing or invalid."""
+
+
+def builder_from_json(report: dict[str, Any]) -> PDFBuilder:
+    """
+    Raises ReportError, before anything is laid out, when `report` does not
+    follow the format above.
+    """
+    if not isinstance(report, dict):
+        raise ReportError("A report is a JSON object, not %s" % type(report).__name__)
+
+    try:
+        header_data = HeaderData(**report.get("header", {}))
+    except TypeError as error:
+        raise ReportError("Invalid header: %s" % error) from error
+
+    components = report.get("components", [])
+    if not isinstance(components, list):
+        raise ReportError("Components are a JSON array")
+
+    pdf = PDFBuilder(header_data=header_data)
+    for index, component in enumerate(components):
+        try:
+            pdf.add_flowable(_component(component))
+        except (KeyError, ValueError, TypeError, AttributeError) as error:
+            raise ReportError("Invalid component %d: %r" % (index, error)) from error
+
+    return pdf
+
+
+def _component(component: dict) -> Flowable:
+    component_type = component.get("type")
+    if component_type not in component_parsers:
+        raise ValueError("Unknown component type: %r" % component_type)
+
+    return component_parsers[component_type](component)
+
+
+def _list(component: dict) -> Flowable:
+    return List(
+        component["title"],
+        ListData(
+            items=component["items"],
+            fields={
+                key: _field(field, ListField)
+                for key, field in component["fields"].items()
+            },
+        ),
+    )
+
+
+def _icon_card_list(component: dict) -> Flowable:
+    return IconCardList(
+        component["title"],
+        [
+            IconCardData(
+                title=item["title"],
+                description=item["description"],
+                icon=SvgPath[item["icon"]],
+                color=Colors[item.get("color", Colors.Gray.name)],
+            )
+            for item in component["items"]
+        ],
+    )
+
+
+def _score(component: dict) -> Flowable:
+    not_valid = component["not_valid"]
+
+    return Score(
+        component["title"],
+        ScoreData(
+            score=component["score"],
+            min_score=component["min_score"],
+            aux_title=component["aux_title"],
+            aux_template=component["aux_template"],
+            not_valid_data=ScoreNotValidData(
+                color=Colors[not_valid["color"]],
+                aux_template=not_valid["aux_template"],
+                description=not_valid["description"],
+                aux_value=not_valid["aux_value"],
+            ),
+            ranges=[
+                ScoreRangeData(
+                    max_score=range_data["max_score"],
+                    color=Colors[range_data["color"]],
+                    description=range_data["description"],
+                    aux_value=range_data["aux_value"],
+                )
+                for range_data in component["ranges"]
+            ],
+        ),
+    )
+
+
+def _gauge_card_list(component: dict) -> Flowable:
+    return GaugeCardList(
+        component["title"],
+        GaugeCardListData(
+            groups=[
+                GaugeCardGroupData(
+                    title=group["title"],
+                    cards=[
+                        GaugeCardData(
+                            title=card["title"],
+                            description=card["description"],
+                            level=card["level"],
+                            level_text=card["level_text"],
+                            color=Colors[card["color"]],
+                        )
+                        for card in group["cards"]
+                    ],
+                )
+                for group in component["groups"]
+            ]
+        ),
+    )
+
+
+def _table(component: dict) -> Flowable:
+    if not all(isinstance(row, dict) for row in component["data"]):
+        raise ValueError("Table rows are JSON objects")
+
+    return Table(
+        component["title"],
+        TableData(
+            columns={
+                key: _field(column, TableColumn)
+                for key, column in component["columns"].items()
+            },
+            data=component["data"],
+            nested_fields={
+                key: _field(field, TableColumn)
+                for key, field in component.get("nested_fields", {}).items()
+            },
+            overview=component.get("overview", {}),
+            row_mode=component.get("row_mode", "wrap"),
+            max_rows=component.get("max_rows"),
+            max_pages=component.get("max_pages"),
+            max_bytes=component.get("max_bytes"),
+            count_label=component.get("count_label"),
+            aggregates={
+                label: _aggregate(spec)
+                for label, spec in component.get("aggregates", {}).items()
+            },
+            group_by=component.get("group_by"),
+            subtotals={
+                label: _aggregate(spec)
+                for label, spec in component.get("subtotals", {}).items()
+            },
+        ),
+    )
+
+
+def _field(field: str | dict, field_type: type):
+    # A plain title, or {"title": "...", "format": {"type": "currency", ...}}
+    if isinstance(field, str):
+        return field
+
+    formatter = None
+    if "format" in field:
+        options = dict(field["format"])
+        formatter_type = options.pop("type")
+        if formatter_type not in formatter_types:
+            raise ValueError("Unknown format type: %r" % formatter_type)
+        if formatter_type == "mask":
+            options["pattern"] = mask_patterns.get(
+                options["pattern"], options["pattern"]
+            )
+        formatter = formatter_types[formatter_type](**options)
+
+    if field_type is TableColumn:
+        return TableColumn(field["title"], field.get("width"), formatter)
+    return ListField(field["title"], formatter)
+
+
+def _aggregate(spec: dict) -> Aggregate:
+    conditions: dict = spec.get("where", {})
+
+    def where(row) -> bool:
+        # Rows whose fields equal all of the given values
+        return all(row.get(key) == value for key, value in conditions.items())
+
+    if spec["type"] == "count":
+        return Count(where=where if conditions else None)
+    if spec["type"] == "sum":
+        return Sum(spec["key"], where=where if conditions else None)
+
+    raise ValueError("Unknown aggregate type: %r" % spec["type"])
+
+
+formatter_types: dict[str, Callable[..., Formatter]] = {
+    "number": Number,
+    "currency": Currency,
+    "mask": Mask,
+    "date": Date,
+    "percent": Percent,
+}
+
+mask_patterns: dict[str, str] = {"cpf": CPF, "cnpj": CNPJ, "cep": CEP}
+
+
+component_parsers: dict[str, Callable[[dict], Flowable]] = {
+    "list": _list,
+    "icon_card_list": _icon_card_list,
+    "score": _score,
+    "gauge_card_list": _gauge_card_list,
+    "table": _table,
+}
@@ -0,0 +1,99 @@
+from reportlab.pdfbase.pdfmetrics import registerFont, registerFontFamily
+from reportlab.pdfbase.ttfonts import TTEncoding, TTFont, TTFontFace
+
+from src.asset_cache import cached
+from src.enums import Poppins
+
+from weakref import WeakKeyDictionary
+
+import threading
+
+
+_lock = threading.Lock()
+_registered = False
+
+
+def register_fonts():
+    """
+    Registers the Poppins family with reportlab, parsing each TTF file only
+    once per process no matter how many times or from how many threads it is
+    called.
+    """
+    global _registered
+    if _registered:
+        return
+
+    with _lock:
+        if _registered:
+            return
+
+        registerFont(_loadFont(Poppins.Regular, Poppins.RegularPath))
+        registerFont(_loadFont(Poppins.Bold, Poppins.BoldPath))
+        registerFont(_loadFont(Poppins.Italic, Poppins.ItalicPath))
+        registerFont(_loadFont(Poppins.BoldItalic, Poppins.BoldItalicPath))
+
+        registerFontFamily(
+            Poppins.Regular,
+            normal=Poppins.Regular,
+            bold=Poppins.Bold,
+            italic=Poppins.Italic,
+            boldItalic=Poppins.BoldItalic,
+        )
+
+        _registered = True
+
+
+class _SharedTTFont(TTFont):
+    """
+    A TTFont registered once and used by documents built in any thread. Its
+    face reads the TTF data through a single file position when subsetting, so
+    the subsets a document embeds are made one document at a time.
+    """
+
+    _subset_lock = threading.Lock()
+
+    def addObjects(self, doc):
+        with self._subset_lock:
+            super().addObjects(doc)
+
+
+def _loadFont(name: str, path: str) -> TTFont:
+    return cached(
+        "font",
+        path,
+        build=lambda: _SharedTTFont(name, path),
+        dump=_dumpFont,
+        load=_restoreFont,
+    )
+
+
+def _dumpFont(font: TTFont) -> dict:
+    # The per-document subsetting state is not cached, and the face's unit
+    # scaling is a closure that is rebuilt from unitsPerEm on load.
+    return {
+        "font": {
+            k: v
+            for k, v in vars(font).items()
+            if k not in ("face", "encoding", "state")
+        },
+        "face": {k: v for k, v in vars(font.face).items() if k != "_pdfScale"},
+    }
+
+
+def _restoreFont(payload: dict) -> TTFont:
+    face = TTFontFace.__new__(TTFontFace)
+    vars(face).update(payload["face"])
+
+    if face.unitsPerEm == 1000:
+        face._pdfScale = lambda x: x
+    else:
+        scale = 1000 / face.unitsPerEm
+        face._pdfScale = lambda x: x * scale
+
+    font = _SharedTTFont.__new__(_SharedTTFont)
+    vars(font).update(payload["font"])
+    font.face = face
+    font.encoding = TTEncoding()
+    font.state = WeakKeyDictionary()
+
+    return font
@@ -1,10 +1,22 @@
 from reportlab.lib.styles import StyleSheet1, ParagraphStyle
 from reportlab.lib import enums
 
-from reportlab.pdfbase.pdfmetrics import registerFont, registerFontFamily
-from reportlab.pdfbase.ttfonts import TTFont
-
 from src.enums import Poppins, Colors
+from src.styles.fonts import register_fonts
+
+from typing import Final
+
+import threading
+
+
+_shared_lock = threading.Lock()
+_shared: "CustomStyleSheet | None" = None
+
+# Derived styles kept by customStyle before starting over
+max_derived_styles: Final[int] = 1024
+
+_derived_lock = threading.Lock()
+_derived: dict[tuple, ParagraphStyle] = {}
 
 
 class CustomStyleSheet(StyleSheet1):
@@ -12,18 +24,7 @@ class CustomStyleSheet(StyleSheet1):
     def __init__(self):
         super().__init__()
 
-        registerFont(TTFont(Poppins.Regular, Poppins.RegularPath))
-        registerFont(TTFont(Poppins.Bold, Poppins.BoldPath))
-        registerFont(TTFont(Poppins.Italic, Poppins.ItalicPath))
-        registerFont(TTFont(Poppins.BoldItalic, Poppins.BoldItalicPath))
-
-        registerFontFamily(
-            Poppins.Regular,
-            normal=Poppins.Regular,
-            bold=Poppins.Bold,
-            italic=Poppins.Italic,
-            boldItalic=Poppins.BoldItalic,
-        )
+        register_fonts()
 
         title_style = {
             "name": "Title",
@@ -115,13 +116,49 @@ class CustomStyleSheet(StyleSheet1):
                 )
             )
 
+        # Text over each of the colors, as cards and scores draw it
+        for style in list(self.byName.values()):
+            for color in Colors:
+                self.textOn(style, color)
+
+    @staticmethod
+    def shared() -> "CustomStyleSheet":
+        """Process-wide stylesheet, built on first use."""
+        global _shared
+        if _shared is None:
+            with _shared_lock:
+                if _shared is None:
+                    _shared = CustomStyleSheet()
+        return _shared
+
     @staticmethod
     def customStyle(style: ParagraphStyle, **kwargs) -> ParagraphStyle:
-        return ParagraphStyle(
-            **{
-                **style.__dict__,
-                **kwargs,
-            }
+        """
+        `style` with the attributes in `kwargs` replaced. Derived styles are
+        interned, the same overrides of the same style return the same
+        ParagraphStyle, so they are shared and must not be changed.
+        """
+        try:
+            key = (style, *sorted(kwargs.items()))
+            return _derived[key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable overrides are not interned
+            return _deriveStyle(style, kwargs)
+
+        with _derived_lock:
+            if key not in _derived:
+                if len(_derived) >= max_derived_styles:
+                    _derived.clear()
+                _derived[key] = _deriveStyle(style, kwargs)
+            return _derived[key]
+
+    @staticmethod
+    def textOn(style: ParagraphStyle, color: Colors) -> ParagraphStyle:
+        """`style` in the text color that reads over `color`."""
+        return CustomStyleSheet.customStyle(
+            style, textColor=Colors.getTextColor(color).value
         )
 
     @property
@@ -219,3 +256,12 @@ class CustomStyleSheet(StyleSheet1):
     @property
     def Score_Right(self) -> ParagraphStyle:
         return self["Score_Right"]
+
+
+def _deriveStyle(style: ParagraphStyle, kwargs: dict) -> ParagraphStyle:
+    return ParagraphStyle(
+        **{
+            **style.__dict__,
+            **kwargs,
+        }
+    )
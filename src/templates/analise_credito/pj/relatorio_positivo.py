@@ -25,7 +25,7 @@ from src.types.misc import DictKey
 
 class RelatorioPositivo:
 
-    def __init__(self):
+    def __init__(self, filename: str = "phello.pdf"):
         reportlab_debug = 0
 
         header_data = HeaderData(
@@ -252,7 +252,7 @@ class RelatorioPositivo:
             ],
         )
 
-        pdf = PDFBuilder("phello.pdf", header_data)
+        pdf = PDFBuilder(filename, header_data)
 
         pdf.add_flowable(
             List("Dados Cadastrais", list_data, debug_flag=reportlab_debug)
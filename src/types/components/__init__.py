@@ -1,5 +1,5 @@
 from .icon_card import IconCardData
-from .list import ListData
+from .list import ListData, ListField
 from .score import ScoreData, ScoreRangeData, ScoreNotValidData
 from .gauge_card import GaugeCardData, GaugeCardGroupData, GaugeCardListData
-from .table import TableData
+from .table import TableData, TableColumn, EncodedColumn, Aggregate, Count, Sum
@@ -1,7 +1,24 @@
+from src.formatters import Formatter
 from src.types.misc import DictKey
 
 
+class ListField:
+    """Field title, its value shown through `formatter` when given."""
+
+    def __init__(self, title: str, formatter: Formatter | None = None):
+        self.title = title
+        self.formatter = formatter
+
+
 class ListData:
-    def __init__(self, items: dict[str, str], fields: dict[DictKey, str]):
-        self.items = items
-        self.fields = fields
+    def __init__(self, items: dict[str, str], fields: dict[DictKey, str | ListField]):
+        self.fields = {
+            key: field.title if isinstance(field, ListField) else field
+            for key, field in fields.items()
+        }
+
+        # Formatted once, not every time the list is laid out
+        self.items = dict(items)
+        for key, field in fields.items():
+            if isinstance(field, ListField) and field.formatter and key in items:
+                self.items[key] = field.formatter(items[key])
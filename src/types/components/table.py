@@ -1,22 +1,633 @@
+from src.formatters import Formatter, format_number, parse_number
 from src.types.misc import DictKey
 
+from array import array
+from collections.abc import Mapping, Sequence
+from typing import Any, Callable, Iterable, Iterator, Literal, overload
+
+
+Row = Mapping[str, str]
+
+ColumnWidth = float | str | None
+
+WidthSampling = Literal["head", "stratified"]
+
+RowMode = Literal["wrap", "fixed"]
+
+GroupBy = DictKey | Callable[[Row], str]
+
+
+class Aggregate:
+    """
+    A value folded over the rows of a table as they are read, for the overview
+    or the group subtotals. Rows rejected by `where` are left out.
+    """
+
+    def __init__(self, where: Callable[[Row], bool] | None = None):
+        self.where = where
+
+    def initial(self) -> Any:
+        return 0
+
+    def step(self, value: Any, row: Row) -> Any:
+        raise NotImplementedError
+
+    def add(self, value: Any, row: Row) -> Any:
+        if self.where is not None and not self.where(row):
+            return value
+        return self.step(value, row)
+
+    def format(self, value: Any) -> str:
+        return format_number(value)
+
+
+class Count(Aggregate):
+    """Number of rows."""
+
+    def step(self, value: int, row: Row) -> int:
+        return value + 1
+
+
+class Sum(Aggregate):
+    """Sum of a numeric field, numbers written either way: 1234.56 or 1.234,56"""
+
+    def __init__(
+        self,
+        key: DictKey,
+        where: Callable[[Row], bool] | None = None,
+        decimals: int = 2,
+    ):
+        super().__init__(where)
+        self.key = key
+        self.decimals = decimals
+
+    def step(self, value: float, row: Row) -> float:
+        return value + parse_number(row.get(self.key))
+
+    def format(self, value: float) -> str:
+        return format_number(value, self.decimals)
+
+
+class GroupTotal:
+    """Key, row count and subtotals of one group of rows."""
+
+    __slots__ = ("key", "count", "values")
+
+    def __init__(self, key: str, values: dict[str, Any]):
+        self.key = key
+        self.count = 0
+        self.values = values
+
+
+class TableTotals:
+    """
+    The aggregates of a table and the subtotals of its groups, folded in as
+    the rows are read for layout, so the data is only walked once. Groups are
+    runs of rows with the same key: the data is expected sorted by it.
+    """
+
+    def __init__(
+        self,
+        aggregates: dict[str, Aggregate],
+        group_by: GroupBy | None,
+        subtotals: dict[str, Aggregate],
+    ):
+        self.aggregates = aggregates
+        self.subtotals = subtotals
+        self.values = {label: agg.initial() for label, agg in aggregates.items()}
+
+        self.group_key: Callable[[Row], str] | None = None
+        if isinstance(group_by, str):
+            self.group_key = lambda row: str(row.get(group_by, ""))
+        elif group_by is not None:
+            self.group_key = group_by
+
+        # Finished groups by the index of their last row
+        self.groups: dict[int, GroupTotal] = {}
+        self.group: GroupTotal | None = None
+        self.last_index = -1
+        self.complete = False
+
+    def add(self, index: int, row: Row):
+        for label, aggregate in self.aggregates.items():
+            self.values[label] = aggregate.add(self.values[label], row)
+
+        if self.group_key is None:
+            return
+
+        key = self.group_key(row)
+        if self.group is None or key != self.group.key:
+            self.closeGroup()
+            self.group = GroupTotal(
+                key, {label: agg.initial() for label, agg in self.subtotals.items()}
+            )
+
+        self.group.count += 1
+        for label, aggregate in self.subtotals.items():
+            self.group.values[label] = aggregate.add(self.group.values[label], row)
+
+        self.last_index = index
+
+    def finish(self):
+        """Called once every row has been added."""
+        self.closeGroup()
+        self.complete = True
+
+    def closeGroup(self):
+        if self.group is not None:
+            self.groups[self.last_index] = self.group
+            self.group = None
+
+    def release(self, index: int):
+        for last_index in [i for i in self.groups if i < index]:
+            del self.groups[last_index]
+
+
+class EncodedColumn(Sequence[str]):
+    """
+    Column of repeated strings stored as integer codes into a dictionary of
+    its distinct values. Codes and dictionary are kept as given, so an array
+    or NumPy array of codes is used without a copy.
+    """
+
+    def __init__(self, codes: Sequence[int], dictionary: Sequence[str]):
+        self.codes = codes
+        self.dictionary = dictionary
+
+    @classmethod
+    def encode(cls, values: Iterable[str]) -> "EncodedColumn":
+        index: dict[str, int] = {}
+        codes = array("I")
+        for value in values:
+            codes.append(index.setdefault(value, len(index)))
+
+        return cls(codes, list(index))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "EncodedColumn": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return EncodedColumn(self.codes[index], self.dictionary)
+
+        return self.dictionary[self.codes[index]]
+
+
+class ColumnarRow(Mapping[str, str]):
+    """One row of a ColumnarRows, read from the columns on access."""
+
+    __slots__ = ("columns", "index")
+
+    def __init__(self, columns: Mapping[str, Sequence[str]], index: int):
+        self.columns = columns
+        self.index = index
+
+    def __getitem__(self, key: str) -> str:
+        return self.columns[key][self.index]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+
+class ColumnarRows(Sequence[Row]):
+    """Table rows stored as one sequence per key instead of a dict per row."""
+
+    def __init__(self, columns: Mapping[str, Sequence[str]]):
+        lengths = {key: len(column) for key, column in columns.items()}
+        if len(set(lengths.values())) > 1:
+            raise ValueError("Columns have different lengths: %r" % lengths)
+
+        self.columns = columns
+        self.length = next(iter(lengths.values()), 0)
+
+    def __len__(self) -> int:
+        return self.length
+
+    @overload
+    def __getitem__(self, index: int) -> Row: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Row]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self.length))]
+
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+
+        return ColumnarRow(self.columns, index)
+
+    def distinct(self, key: str) -> Sequence[str] | None:
+        """Distinct values of a dictionary encoded column, None for others."""
+        column = self.columns.get(key)
+        return column.dictionary if isinstance(column, EncodedColumn) else None
+
+
+class TableRows:
+    """
+    Row access by index over a table source, made by `TableRows.of`: lists are
+    indexed directly, iterators are pulled on demand and only keep the rows not
+    yet released. Rows past `limit` are not read, only counted.
+    """
+
+    def __init__(self, limit: int | None, totals: TableTotals | None):
+        self.limit = limit
+        self.totals = totals
+
+    @staticmethod
+    def of(
+        data: Iterable[Row],
+        limit: int | None = None,
+        totals: TableTotals | None = None,
+    ) -> "TableRows":
+        if isinstance(data, Sequence):
+            return SequenceRows(data, limit, totals)
+        return IteratorRows(iter(data), limit, totals)
+
+    def get(self, index: int) -> Row | None:
+        """Returns the row at `index`, or None past the end of the data."""
+        raise NotImplementedError
+
+    def available(self, start: int, limit: int) -> int:
+        """Number of rows from `start` on, counting no further than `limit`."""
+        raise NotImplementedError
+
+    def count(self) -> int | None:
+        """Number of rows, None when the data is an iterator."""
+        return None
+
+    def total(self) -> int:
+        """Number of rows in the data, past the limit too."""
+        raise NotImplementedError
+
+    def remaining(self, index: int) -> int:
+        """
+        Rows of the data from `index` on, past the limit too, they are the ones
+        a table leaves out.
+        """
+        raise NotImplementedError
+
+    def more(self, index: int) -> bool:
+        """Whether the data has rows from `index` on, past the limit too."""
+        raise NotImplementedError
+
+    def release(self, index: int):
+        """Drops the rows before `index`, they will not be read again."""
+        if self.totals is not None:
+            self.totals.release(index)
+
+
+class SequenceRows(TableRows):
+    """Rows of a list, added to the totals as they are first read."""
+
+    def __init__(
+        self,
+        sequence: Sequence[Row],
+        limit: int | None = None,
+        totals: TableTotals | None = None,
+    ):
+        super().__init__(limit, totals)
+        self.sequence = sequence
+        self.added = 0
+
+    def get(self, index: int) -> Row | None:
+        if self.limit is not None and index >= self.limit:
+            return None
+
+        if index < len(self.sequence):
+            self._addUpTo(index + 1)
+            return self.sequence[index]
+
+        self._finish()
+        return None
+
+    def available(self, start: int, limit: int) -> int:
+        if limit <= 0:
+            return 0
+        return max(0, min(limit, self.count() - start))
+
+    def count(self) -> int:
+        return (
+            len(self.sequence)
+            if self.limit is None
+            else min(self.limit, len(self.sequence))
+        )
+
+    def total(self) -> int:
+        return len(self.sequence)
+
+    def remaining(self, index: int) -> int:
+        self._finish()
+        return max(0, len(self.sequence) - index)
+
+    def more(self, index: int) -> bool:
+        return index < len(self.sequence)
+
+    def _addUpTo(self, end: int):
+        if self.totals is None:
+            return
+        while self.added < end:
+            self.totals.add(self.added, self.sequence[self.added])
+            self.added += 1
+
+    def _finish(self):
+        if self.totals is not None:
+            self._addUpTo(len(self.sequence))
+            self.totals.finish()
+
+
+class IteratorRows(TableRows):
+    """
+    Rows of an iterator, read no further than asked. Rows are buffered until
+    released, the ones past the limit are only counted.
+    """
+
+    def __init__(
+        self,
+        iterator: Iterator[Row],
+        limit: int | None = None,
+        totals: TableTotals | None = None,
+    ):
+        super().__init__(limit, totals)
+        self.iterator = iterator
+        self.buffer: list[Row] = []
+        self.offset = 0
+        self.counted: int | None = None
+
+    def get(self, index: int) -> Row | None:
+        if self.limit is not None and index >= self.limit:
+            return None
+
+        if index < self.offset:
+            raise RuntimeError(
+                "Row %d was already released, tables backed by an iterator "
+                "can only be laid out once" % index
+            )
+
+        while index >= self.offset + len(self.buffer):
+            if not self._pull():
+                return None
+
+        return self.buffer[index - self.offset]
+
+    def available(self, start: int, limit: int) -> int:
+        if limit <= 0:
+            return 0
+
+        self.get(start + limit - 1)
+        return max(0, min(limit, self.offset + len(self.buffer) - start))
+
+    def total(self) -> int:
+        """
+        The iterator is read to its end: rows up to the limit are buffered, the
+        others only counted, so without a limit all of them are kept.
+        """
+        if self.counted is None:
+            if self.limit is None:
+                while self._pull():
+                    pass
+            elif self.limit > self.offset:
+                self.get(self.limit - 1)
+            self.counted = self._countRest()
+
+        return self.counted
+
+    def remaining(self, index: int) -> int:
+        """The rows not read yet are counted without being kept."""
+        if self.counted is None:
+            self.counted = self._countRest()
+
+        return max(0, self.counted - index)
+
+    def more(self, index: int) -> bool:
+        """The iterator is read no further than the row at `index`."""
+        if self.counted is not None:
+            return index < self.counted
+
+        while index >= self.offset + len(self.buffer):
+            if not self._pull():
+                return False
+
+        return True
+
+    def release(self, index: int):
+        if index > self.offset:
+            del self.buffer[: index - self.offset]
+            self.offset = index
+
+        super().release(index)
+
+    def _pull(self) -> bool:
+        """Buffers the next row of the iterator, False at its end."""
+        try:
+            row = next(self.iterator)
+        except StopIteration:
+            if self.totals is not None:
+                self.totals.finish()
+            return False
+
+        self.buffer.append(row)
+        if self.totals is not None:
+            self.totals.add(self.offset + len(self.buffer) - 1, row)
+        return True
+
+    def _countRest(self) -> int:
+        """Reads the iterator to its end, returning the number of rows read."""
+        read = self.offset + len(self.buffer)
+        rest = 0
+        for row in self.iterator:
+            if self.totals is not None:
+                self.totals.add(read + rest, row)
+            rest += 1
+
+        if self.totals is not None:
+            self.totals.finish()
+        return read + rest
+
+
+class TableColumn:
+    """
+    Column title with a width hint, in points or as a percentage of the table
+    width ("25%"). Columns without a hint are sized from their content.
+    The values of the column are shown through `formatter`, when given.
+    """
+
+    def __init__(
+        self,
+        title: str,
+        width: ColumnWidth = None,
+        formatter: Formatter | None = None,
+    ):
+        self.title = title
+        self.width = width
+        self.formatter = formatter
+
 
 class TableData:
+    """
+    Columns, rows and nested fields of a table. With the "fixed" row mode every
+    cell and nested value is kept to a single line, cut with an ellipsis when
+    too wide, so all rows have the same height and pages are laid out by
+    arithmetic; "wrap" rows grow to fit their content.
+
+    `max_rows`, `max_pages` and `max_bytes` (of the text and backgrounds of
+    the rows, before compression) stop the table early, ending it with a row
+    telling how many rows were left out. `count_label` adds the number of rows, all of them,
+    to the overview: it is a `Count` among the aggregates.
+
+    `aggregates` add values computed over all the rows to the overview, and
+    `group_by` (a key or a function of the row) ends each run of rows with the
+    same group with a row counting them, with the `subtotals` of the group.
+    Both are folded in while the rows are read for layout.
+
+    `rows` and `totals` are made anew by `startLayout`, at the start of every
+    layout of the table.
+    """
+
     def __init__(
         self,
-        columns: dict[DictKey, str],
-        data: list[dict[str, str]],
-        nested_fields: dict[DictKey, str] = {},
+        columns: dict[DictKey, str | TableColumn],
+        data: Iterable[Row],
+        nested_fields: dict[DictKey, str | TableColumn] = {},
         overview: dict[str, str] = {},
+        width_sample: int = 100,
+        width_sampling: WidthSampling = "head",
+        row_mode: RowMode = "wrap",
+        max_rows: int | None = None,
+        max_pages: int | None = None,
+        max_bytes: int | None = None,
+        more_rows_template: str = "e mais %s registros",
+        count_label: str | None = None,
+        aggregates: dict[str, Aggregate] = {},
+        group_by: GroupBy | None = None,
+        subtotals: dict[str, Aggregate] = {},
+        group_template: str = "%s: %s registros",
     ):
-        self.columns = columns
+        if group_by is not None and row_mode == "fixed":
+            raise ValueError("Rows can not be grouped in the fixed row mode")
+
+        self.columns = {
+            key: column if isinstance(column, TableColumn) else TableColumn(column)
+            for key, column in columns.items()
+        }
         self.data = data
-        self.nested_fields = nested_fields
+        self.nested_fields = {
+            key: field.title if isinstance(field, TableColumn) else field
+            for key, field in nested_fields.items()
+        }
         self.overview = overview
+        self.width_sample = width_sample
+        self.width_sampling = width_sampling
+        self.row_mode = row_mode
+        self.max_rows = max_rows
+        self.max_pages = max_pages
+        self.max_bytes = max_bytes
+        self.more_rows_template = more_rows_template
+        self.count_label = count_label
+        # Counted while streaming like any other aggregate, the rows are not
+        # read ahead to know their number
+        self.aggregates = (
+            {count_label: Count(), **aggregates} if count_label else aggregates
+        )
+        self.group_by = group_by
+        self.subtotals = subtotals
+        self.group_template = group_template
+
+        # Made by every layout of the table, see startLayout
+        self.rows: TableRows
+        self.totals: TableTotals | None = None
+        self.laid_out = False
+
+        # Values are formatted as they are read, aggregates see them raw
+        self.formatters: dict[str, Formatter] = {
+            key: field.formatter
+            for key, field in [*self.columns.items(), *nested_fields.items()]
+            if isinstance(field, TableColumn) and field.formatter is not None
+        }
+
+    @classmethod
+    def from_columns(
+        cls,
+        columns: dict[DictKey, str | TableColumn],
+        data: Mapping[str, Sequence[str]],
+        nested_fields: dict[DictKey, str | TableColumn] = {},
+        overview: dict[str, str] = {},
+        encode: bool = True,
+        **kwargs,
+    ) -> "TableData":
+        """
+        Table from one sequence per data key. Plain sequences are dictionary
+        encoded, unless `encode` is False; EncodedColumns and, without
+        encoding, plain sequences are referenced as they are, not copied.
+        """
+        if encode:
+            data = {
+                key: (
+                    column
+                    if isinstance(column, EncodedColumn)
+                    else EncodedColumn.encode(column)
+                )
+                for key, column in data.items()
+            }
+
+        return cls(columns, ColumnarRows(data), nested_fields, overview, **kwargs)
+
+    def startLayout(self):
+        """
+        Reads the rows again from the start, with the totals and group
+        subtotals from scratch, for a new layout of the table. Iterators can
+        only be read once, a second layout of a table backed by one raises.
+        """
+        if self.laid_out and not isinstance(self.data, Sequence):
+            raise RuntimeError("Tables backed by an iterator can only be laid out once")
+
+        self.totals = None
+        if self.aggregates or self.group_by is not None:
+            self.totals = TableTotals(self.aggregates, self.group_by, self.subtotals)
+
+        self.rows = TableRows.of(self.data, limit=self.max_rows, totals=self.totals)
+        self.laid_out = True
+
+    @property
+    def header(self) -> list[str]:
+        return [column.title for column in self.columns.values()]
 
     @property
-    def matrix(self) -> list[list]:
-        return [
-            [self.columns[key] for key in self.columns],
-            *[[row[key] for key in self.columns] for row in self.data],
-        ]
+    def width_hints(self) -> list[ColumnWidth]:
+        return [column.width for column in self.columns.values()]
+
+    def cells(self, row: Row) -> list[str]:
+        if not self.formatters:
+            return [row[key] for key in self.columns]
+        return [self.formatted(key, row[key]) for key in self.columns]
+
+    def formatted(self, key: str, value):
+        formatter = self.formatters.get(key)
+        return formatter(value) if formatter is not None else value
+
+    def distinct_values(self, key: str) -> Sequence[str] | None:
+        """
+        All the distinct values of a column, formatted, when the storage
+        knows them. Formatting them as a batch fills the formatter memo for
+        the rows.
+        """
+        if not isinstance(self.data, ColumnarRows):
+            return None
+
+        values = self.data.distinct(key)
+        formatter = self.formatters.get(key)
+        if values is not None and formatter is not None:
+            return formatter.batch(values)
+        return values
@@ -0,0 +1,30 @@
+from src.components.header import HeaderData
+from src.components.table import Table
+from src.pdf_builder import PDFBuilder
+from src.types.components import TableData
+
+import pytest
+
+
+@pytest.fixture
+def page_texts():
+    """Text of every page of a PDF, as extracted by PyMuPDF."""
+    pymupdf = pytest.importorskip("pymupdf")
+
+    def extract(data: bytes) -> list[str]:
+        with pymupdf.open(stream=data, filetype="pdf") as document:
+            return [page.get_text() for page in document]
+
+    return extract
+
+
+@pytest.fixture
+def table_builder():
+    """A builder of a report holding a single table, made from its TableData."""
+
+    def make(table_data: TableData, title: str = "Tabela") -> PDFBuilder:
+        builder = PDFBuilder(header_data=HeaderData())
+        builder.add_flowable(Table(title, table_data))
+        return builder
+
+    return make
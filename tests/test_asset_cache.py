@@ -0,0 +1,62 @@
+from src import asset_cache
+
+import os
+import stat
+
+import pytest
+
+
+def build(path):
+    with open(path) as file:
+        return file.read()
+
+
+def test_entries_kept_apart(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    monkeypatch.setenv("PDF_ASSET_CACHE_DIR", str(cache))
+
+    # Two assets with the same name in different directories
+    paths = []
+    for name in ("a", "b"):
+        (tmp_path / name).mkdir()
+        path = tmp_path / name / "icon.svg"
+        path.write_text(name)
+        paths.append(str(path))
+
+    for path in paths:
+        asset_cache.cached("icon", path, build=lambda path=path: build(path))
+
+    # An entry left by another version, from another environment
+    other = cache / "icon-icon.svg-000000000000-v0-rl0-svg0-py0.0-0.pickle"
+    other.write_bytes(b"")
+
+    for path in paths:
+        asset_cache.cached("icon", path, build=lambda path=path: build(path))
+    assert len(os.listdir(cache)) == 3
+
+    asset_cache.prune()
+    assert len(os.listdir(cache)) == 2
+    assert not other.exists()
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions")
+def test_shared_directory_not_used(tmp_path, monkeypatch):
+    private = tmp_path / "private"
+    monkeypatch.setenv("PDF_ASSET_CACHE_DIR", str(private))
+    path = tmp_path / "icon.svg"
+    path.write_text("icon")
+
+    asset_cache.cached("icon", str(path), build=lambda: build(path))
+    assert stat.S_IMODE(os.stat(private).st_mode) & 0o077 == 0
+    assert len(os.listdir(private)) == 1
+
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    monkeypatch.setenv("PDF_ASSET_CACHE_DIR", str(shared))
+
+    builds = []
+    for _ in range(2):
+        asset_cache.cached("icon", str(path), build=lambda: builds.append(path))
+    assert len(builds) == 2
+    assert os.listdir(shared) == []
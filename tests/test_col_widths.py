@@ -0,0 +1,54 @@
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Table
+
+from src.primitives.col_widths import estimate_col_widths
+from src.primitives.table import _formatHeaders
+from src.types.components import TableData
+from src.types.misc import DictKey
+
+import io
+import random
+
+import pytest
+
+
+titles = ["Data", "Descrição longa", "A", "Protocolo de atendimento"]
+
+words = [
+    "a",
+    "Consulta",
+    "WWWW",
+    "iiiiiiii",
+    "Usuário",
+    "12/04/2024",
+    "5202315259018723807912038",
+    "x\ny longer line",
+]
+
+
+def test_matches_reportlab_auto_widths():
+    rand = random.Random(1)
+    canvas = Canvas(io.BytesIO())
+
+    for _ in range(300):
+        columns = {
+            DictKey("c%d" % col): rand.choice(titles)
+            for col in range(rand.randint(1, 6))
+        }
+        data = [
+            {
+                key: " ".join(rand.choice(words) for _ in range(rand.randint(1, 3)))
+                for key in columns
+            }
+            for _ in range(rand.randint(0, 60))
+        ]
+        avail_width = rand.choice([200, 400, 560, 800])
+
+        table_data = TableData(columns, data)
+        header = _formatHeaders(table_data.header)
+        table = Table([header, *[table_data.cells(row) for row in data]])
+        table.wrapOn(canvas, avail_width, 1000)
+
+        table_data.startLayout()
+        estimated = estimate_col_widths(table_data, header, avail_width)
+        assert estimated == pytest.approx(table._colWidths, abs=1e-6), data
@@ -0,0 +1,71 @@
+from reportlab.pdfgen.canvas import Canvas
+
+from src.pdf_builder import PDFBuilder
+from src.primitives.composite import CompositeFlowable
+
+import io
+
+
+class Counted(CompositeFlowable):
+    """A composite counting its layouts and the documents it was drawn in."""
+
+    def __init__(self, height: float = 10):
+        self.item_height = height
+        self.layouts = 0
+        self.documents = 0
+
+    def startDocument(self):
+        self.documents += 1
+
+    def layout(self, aW, aH):
+        self.layouts += 1
+        return (aW, self.item_height)
+
+    def draw(self):
+        pass
+
+
+class HeightSensitive(Counted):
+    height_sensitive = True
+
+
+def test_laid_out_once_per_size():
+    canvas = Canvas(io.BytesIO())
+    flowable = Counted()
+
+    for height in (100, 200, 100):
+        assert flowable.wrapOn(canvas, 300, height) == (300, 10)
+    assert flowable.layouts == 1
+
+    flowable.wrapOn(canvas, 200, 100)
+    assert flowable.layouts == 2
+
+    sensitive = HeightSensitive()
+    for height in (100, 200, 200):
+        sensitive.wrapOn(canvas, 300, height)
+    assert sensitive.layouts == 2
+
+
+def test_invalidate():
+    canvas = Canvas(io.BytesIO())
+    flowable = Counted()
+    flowable.wrapOn(canvas, 300, 100)
+
+    flowable.item_height = 20
+    assert flowable.wrapOn(canvas, 300, 100) == (300, 10)
+
+    flowable.invalidate()
+    assert flowable.wrapOn(canvas, 300, 100) == (300, 20)
+    assert flowable.layouts == 2
+
+
+def test_laid_out_again_per_document():
+    flowable = Counted()
+    builder = PDFBuilder()
+    builder.add_flowable(flowable)
+
+    builder.build_bytes()
+    assert (flowable.documents, flowable.layouts) == (1, 1)
+
+    builder.build_bytes()
+    assert (flowable.documents, flowable.layouts) == (2, 2)
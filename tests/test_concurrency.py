@@ -0,0 +1,144 @@
+from src.report_json import builder_from_json
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+
+"""
+Reports built from many threads at once come out the same as built one after
+the other, and so do builders built more than once.
+"""
+
+
+threads = 16
+
+
+def report(index: int) -> dict:
+    """A report of its own for every index: other texts, sizes and page counts."""
+    return {
+        "header": {
+            "category_name": "Análise de crédito",
+            "product_name": "Relatório %d" % index,
+            "entity_name": "EMPRESA %d" % index,
+            "entity_id": "00.000.%03d/0001-00" % index,
+            "date_time": "12/04/2024 - 10:%02d" % index,
+            "protocol": "52023152-%08d" % index,
+        },
+        "components": [
+            {
+                "type": "list",
+                "title": "Dados Cadastrais",
+                "fields": {"razao_social": "Razão Social", "cidade": "Cidade"},
+                "items": {
+                    "razao_social": "EMPRESA %d " % index * (index % 4 + 1),
+                    "cidade": "CIDADE %d" % index,
+                },
+            },
+            {
+                "type": "icon_card_list",
+                "title": "Resumo",
+                "items": [
+                    {
+                        "title": "Protestos",
+                        "description": "R$%dK" % (index * 7),
+                        "icon": ["Check", "Warning", "Error"][index % 3],
+                        "color": ["Green", "Orange", "Red"][index % 3],
+                    }
+                ]
+                * (index % 5 + 1),
+            },
+            {
+                "type": "score",
+                "title": "Score",
+                "score": 300 + index * 40,
+                "min_score": 300,
+                "aux_title": "Risco de Crédito",
+                "aux_template": "O risco de não pagamento é %s.",
+                "not_valid": {
+                    "color": "Gray",
+                    "aux_template": "Score indisponível.",
+                    "description": "Não se aplica",
+                    "aux_value": "Não se aplica",
+                },
+                "ranges": [
+                    {
+                        "max_score": 600,
+                        "color": "Red",
+                        "description": "Ruim",
+                        "aux_value": "Alto",
+                    },
+                    {
+                        "max_score": 1000,
+                        "color": "Green",
+                        "description": "Ótimo",
+                        "aux_value": "Baixo",
+                    },
+                ],
+            },
+            {
+                "type": "gauge_card_list",
+                "title": "Indicadores",
+                "groups": [
+                    {
+                        "title": "Pontualidade",
+                        "cards": [
+                            {
+                                "title": "Tempo de atraso",
+                                "description": "Dívidas pagas com atraso",
+                                "level": index % 3 + 1,
+                                "level_text": "Risco %d" % (index % 3 + 1),
+                                "color": ["Green", "Orange", "Red"][index % 3],
+                            }
+                        ],
+                    }
+                ],
+            },
+            {
+                "type": "table",
+                "title": "Histórico de Consultas",
+                "columns": {"data": "Data", "usuario": "Usuário", "valor": "Valor"},
+                "nested_fields": {"protocolo": "Protocolo"},
+                "data": [
+                    {
+                        "data": "%02d/%02d/2024" % (row % 10 + 1, row // 10 + 1),
+                        "mes": "%02d/2024" % (row // 10 + 1),
+                        "usuario": "Usuário %d-%d" % (index, row),
+                        "valor": "%d,50" % (row * index % 100),
+                        "protocolo": "P%d " % row * (row % 5 + 1),
+                    }
+                    for row in range(10 * index + 5)
+                ],
+                "count_label": "Total de consultas",
+                "aggregates": {"Valor total": {"type": "sum", "key": "valor"}},
+                "group_by": "mes",
+                "subtotals": {"Valor": {"type": "sum", "key": "valor"}},
+                "max_pages": 3 if index % 4 == 0 else None,
+            },
+        ],
+    }
+
+
+def test_threads_match_serial(page_texts):
+    serial = [
+        page_texts(builder_from_json(report(i)).build_bytes()) for i in range(threads)
+    ]
+
+    barrier = Barrier(threads)
+
+    def build(index: int) -> bytes:
+        builder = builder_from_json(report(index))
+        barrier.wait()
+        return builder.build_bytes()
+
+    with ThreadPoolExecutor(threads) as executor:
+        concurrent = [page_texts(data) for data in executor.map(build, range(threads))]
+
+    assert concurrent == serial
+
+
+def test_rebuild(page_texts):
+    for index in range(threads):
+        builder = builder_from_json(report(index))
+
+        first = page_texts(builder.build_bytes())
+        assert page_texts(builder.build_bytes()) == first
@@ -0,0 +1,46 @@
+from reportlab.pdfbase import ttfonts
+
+from src.styles import fonts
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Counts the TTF files parsed, with the fonts not registered yet."""
+    parsed = []
+    parse = ttfonts.TTFontFile.__init__
+
+    def counting(self, file, *args, **kwargs):
+        parsed.append(file)
+        parse(self, file, *args, **kwargs)
+
+    monkeypatch.setattr(ttfonts.TTFontFile, "__init__", counting)
+    monkeypatch.setattr(fonts, "_registered", False)
+    return parsed
+
+
+def test_cached_fonts_not_parsed(parses, tmp_path, monkeypatch):
+    monkeypatch.setenv("PDF_ASSET_CACHE_DIR", str(tmp_path))
+
+    fonts.register_fonts()
+    assert len(parses) == 4
+
+    monkeypatch.setattr(fonts, "_registered", False)
+    fonts.register_fonts()
+    assert len(parses) == 4
+
+
+def test_fonts_parsed_once_without_cache(parses, monkeypatch):
+    monkeypatch.setenv("PDF_ASSET_CACHE_DIR", "")
+
+    with ThreadPoolExecutor(8) as executor:
+        for _ in range(16):
+            executor.submit(fonts.register_fonts)
+
+    assert len(parses) == 4
+
+    fonts.register_fonts()
+    assert len(parses) == 4
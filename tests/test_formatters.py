@@ -0,0 +1,21 @@
+from src.formatters import Currency
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "value, text",
+    [
+        (999, "R$ 999,00"),
+        (1000, "R$1K"),
+        (127_400, "R$127K"),
+        (1_250_000, "R$1,2M"),
+        (999_499_999, "R$999M"),
+        # Amounts that round up to the next scale
+        (999_950, "R$1M"),
+        (999_500_000, "R$1B"),
+        (-999_950, "-R$1M"),
+    ],
+)
+def test_compact_currency(value, text):
+    assert Currency(compact=True)(value) == text
@@ -0,0 +1,13 @@
+from src.components.header import HeaderData
+from src.pdf_builder import PDFBuilder
+
+from reportlab.platypus import Spacer
+
+
+def test_pagination_without_room(page_texts):
+    # A protocol too long for the header pushes the pagination anchor out
+    header_data = HeaderData(protocol="Protocolo " + "123456789 " * 40)
+    builder = PDFBuilder(header_data=header_data)
+    builder.add_flowable(Spacer(1, 10))
+
+    assert "Página 1 de 1" in page_texts(builder.build_bytes())[0]
@@ -0,0 +1,37 @@
+from src.enums import Colors, SvgPath
+from src.primitives.icon import getIconDrawing
+from src.report_json import builder_from_json
+
+import pytest
+
+
+def icon_cards(colors: list[str]) -> dict:
+    items = [
+        {"title": "Card %d" % i, "description": "d", "icon": "Warning", "color": color}
+        for i, color in enumerate(colors)
+    ]
+    return {"components": [{"type": "icon_card_list", "title": "T", "items": items}]}
+
+
+def test_variants_shared():
+    orange = getIconDrawing(SvgPath.Warning, 24, 0, Colors.Orange)
+    assert getIconDrawing(SvgPath.Warning, 24, 0, Colors.Orange) is orange
+    assert getIconDrawing(SvgPath.Warning, 24, 0, Colors.Green) is not orange
+
+
+def test_one_form_per_variant():
+    pymupdf = pytest.importorskip("pymupdf")
+    data = builder_from_json(icon_cards(["Orange"] * 12 + ["Green"] * 3)).build_bytes()
+
+    with pymupdf.open(stream=data, filetype="pdf") as document:
+        page = document[0]
+        forms = [name for _, name, *_ in page.get_xobjects() if "icon_" in name]
+        content = page.read_contents()
+
+    assert sorted(forms) == [
+        "FormXob.icon_Warning_24_0_Green_1_0",
+        "FormXob.icon_Warning_24_0_Orange_1_0",
+    ]
+    # Each placement is a reference to the form, not the paths of the icon
+    assert content.count(b"/FormXob.icon_Warning_24_0_Orange_1_0 Do") == 12
+    assert content.count(b"/FormXob.icon_Warning_24_0_Green_1_0 Do") == 3
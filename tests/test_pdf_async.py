@@ -0,0 +1,44 @@
+from src.pdf_async import AsyncRenderer
+
+from concurrent.futures import ThreadPoolExecutor
+
+import asyncio
+import threading
+import time
+
+
+class SlowBuilder:
+    """Takes a while to notice a cancellation, like a long flowable."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+
+    def build_bytes(self, cancel_event: threading.Event) -> bytes:
+        with self.lock:
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+
+        time.sleep(0.1)
+
+        with self.lock:
+            self.running -= 1
+        return b""
+
+
+def test_timeouts_keep_their_slot():
+    builder = SlowBuilder()
+    executor = ThreadPoolExecutor(max_workers=8)
+    renderer = AsyncRenderer(max_concurrency=2, timeout=0.01, executor=executor)
+
+    async def render_all():
+        return await asyncio.gather(
+            *(renderer.render(builder) for _ in range(6)), return_exceptions=True
+        )
+
+    results = asyncio.run(render_all())
+    executor.shutdown(wait=True)
+
+    assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+    assert builder.most_running == 2
@@ -0,0 +1,46 @@
+from src.pdf_batch import render_batch
+from src.report_json import builder_from_json
+
+from functools import partial
+
+import os
+
+
+def render(path: str, rows: int) -> int:
+    builder_from_json(
+        {
+            "components": [
+                {
+                    "type": "table",
+                    "title": "Tabela",
+                    "columns": {"a": "A"},
+                    "data": [{"a": str(i)} for i in range(rows)],
+                }
+            ]
+        }
+    ).build(path)
+    return os.getpid()
+
+
+def test_render_batch(tmp_path):
+    paths = [str(tmp_path / ("%d.pdf" % i)) for i in range(6)]
+    jobs = [partial(render, path, 20 * i) for i, path in enumerate(paths)]
+    jobs.insert(3, partial(int, "x"))
+
+    results = sorted(
+        render_batch(jobs, workers=2, max_tasks_per_child=2),
+        key=lambda result: result.index,
+    )
+    assert [result.index for result in results] == list(range(7))
+
+    # A failed job is reported without stopping the others
+    failed = [result for result in results if not result.ok]
+    assert [result.index for result in failed] == [3]
+    assert isinstance(failed[0].error, ValueError)
+
+    for path in paths:
+        with open(path, "rb") as file:
+            assert file.read(5) == b"%PDF-"
+
+    # Workers are replaced after two jobs each
+    assert len({result.value for result in results if result.ok}) >= 3
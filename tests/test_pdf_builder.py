@@ -0,0 +1,35 @@
+from src.pdf_builder import PDFBuilder
+from src.types.components import TableData
+
+import io
+
+import pytest
+
+
+@pytest.fixture
+def builder(table_builder) -> PDFBuilder:
+    data = [{"a": "x%d" % i, "b": "y " * (i % 30)} for i in range(300)]
+    return table_builder(TableData({"a": "A", "b": "B"}, data))
+
+
+def test_outputs_match(page_texts, builder, tmp_path):
+    expected = page_texts(builder.build_bytes())
+    assert len(expected) > 1
+
+    path = tmp_path / "report.pdf"
+    builder.build(str(path))
+    assert page_texts(path.read_bytes()) == expected
+
+    output = io.BytesIO()
+    builder.build(output)
+    assert page_texts(output.getvalue()) == expected
+
+    chunks = list(builder.build_chunks(chunk_size=4096))
+    assert all(len(chunk) == 4096 for chunk in chunks[:-1])
+    assert 0 < len(chunks[-1]) <= 4096
+    assert page_texts(b"".join(chunks)) == expected
+
+
+def test_build_needs_output(builder):
+    with pytest.raises(ValueError):
+        builder.build()
@@ -0,0 +1,115 @@
+from src.render_daemon import RenderQueue, _RenderRequestHandler, _TCPRenderServer
+
+from http.client import HTTPConnection
+
+import json
+import threading
+import time
+
+import pytest
+
+
+report = {
+    "header": {"category_name": "Teste"},
+    "components": [
+        {"type": "table", "title": "T", "columns": {"a": "A"}, "data": [{"a": "1"}]}
+    ],
+}
+
+
+class _BlockedBuilder:
+    # Holds a render thread until released
+    def __init__(self, release: threading.Event):
+        self.release = release
+
+    def build_bytes(self) -> bytes:
+        self.release.wait()
+        return b""
+
+
+@pytest.fixture
+def daemon():
+    render_queue = RenderQueue(workers=1, max_queue=1)
+    render_queue.start()
+
+    server = _TCPRenderServer(("127.0.0.1", 0), _RenderRequestHandler)
+    server.render_queue = render_queue
+    server.verbose = False
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+    render_queue.stop()
+
+
+def request(server, method: str, path: str, body: bytes | None = None):
+    connection = HTTPConnection(*server.server_address)
+    connection.request(method, path, body)
+    response = connection.getresponse()
+    return response.status, response.getheaders(), response.read()
+
+
+def post(server, body) -> int:
+    data = body if isinstance(body, bytes) else json.dumps(body).encode()
+    return request(server, "POST", "/render", data)[0]
+
+
+def test_statuses(daemon):
+    status, headers, body = request(
+        daemon, "POST", "/render", json.dumps(report).encode()
+    )
+    assert status == 200
+    assert dict(headers)["Content-Type"] == "application/pdf"
+    assert body.startswith(b"%PDF")
+
+    # Reports that do not follow the format
+    assert post(daemon, b"{") == 400
+    assert post(daemon, [report]) == 400
+    assert post(daemon, {"components": [{"type": "chart"}]}) == 400
+    assert post(daemon, {"components": [{"type": "table", "title": "T"}]}) == 400
+    assert post(daemon, {"header": {"color": "Red"}}) == 400
+
+    # A valid report that fails while it is laid out
+    table = {**report["components"][0], "data": [{"a": "1"}] * 200}
+    failing = {"components": [{**table, "max_pages": "2"}]}
+    assert post(daemon, failing) == 500
+
+    assert request(daemon, "GET", "/missing")[0] == 404
+
+
+def test_full_queue(daemon):
+    render_queue = daemon.render_queue
+    release = threading.Event()
+
+    # One job held by the render thread, the next fills the queue
+    futures = [render_queue.submit(_BlockedBuilder(release))]
+    while not render_queue.stats()["in_flight"]:
+        time.sleep(0.01)
+    futures.append(render_queue.submit(_BlockedBuilder(release)))
+
+    status, headers, _ = request(daemon, "POST", "/render", json.dumps(report).encode())
+    assert status == 503
+    assert dict(headers)["Retry-After"] == "1"
+
+    release.set()
+    for future in futures:
+        assert future is not None
+        future.result(timeout=10)
+
+    assert post(daemon, report) == 200
+
+
+def test_stats(daemon):
+    post(daemon, report)
+    post(daemon, {"components": [{"type": "chart"}]})
+
+    status, _, body = request(daemon, "GET", "/stats")
+    assert status == 200
+
+    stats = json.loads(body)
+    assert stats["completed"] == 1
+    assert stats["failed"] == stats["rejected"] == stats["in_flight"] == 0
+    assert stats["queue_capacity"] == 1
+    assert stats["render_ms"]["count"] == 1
@@ -0,0 +1,42 @@
+from src.enums import Colors
+from src.styles import stylesheet
+from src.styles.stylesheet import CustomStyleSheet
+
+
+styles = CustomStyleSheet.shared()
+
+
+def test_derived_styles_interned():
+    derived = CustomStyleSheet.customStyle(styles.Body, fontSize=20, leading=24)
+
+    assert derived.fontSize == 20 and derived.leading == 24
+    assert derived.fontName == styles.Body.fontName
+    assert styles.Body.fontSize != 20
+    # The same overrides in any order give the same style
+    assert CustomStyleSheet.customStyle(styles.Body, leading=24, fontSize=20) is (
+        derived
+    )
+    assert CustomStyleSheet.customStyle(styles.Body, fontSize=21) is not derived
+    assert CustomStyleSheet.customStyle(styles.Title, fontSize=20) is not derived
+
+
+def test_unhashable_overrides_not_interned():
+    tabs = [(10, "left")]
+    style = CustomStyleSheet.customStyle(styles.Body, bulletAnchor=tabs)
+    assert style.bulletAnchor == tabs
+    assert CustomStyleSheet.customStyle(styles.Body, bulletAnchor=tabs) is not style
+
+
+def test_interned_styles_bounded(monkeypatch):
+    monkeypatch.setattr(stylesheet, "max_derived_styles", 4)
+
+    for size in range(10):
+        CustomStyleSheet.customStyle(styles.Body, fontSize=size)
+        assert len(stylesheet._derived) <= 4
+
+
+def test_text_on():
+    for color in Colors:
+        style = CustomStyleSheet.textOn(styles.Body, color)
+        assert style.textColor == Colors.getTextColor(color).value
+        assert CustomStyleSheet.textOn(styles.Body, color) is style
@@ -0,0 +1,65 @@
+from reportlab.pdfbase.pdfmetrics import stringWidth
+
+from src.primitives import metrics
+from src.primitives.col_widths import column_minimums
+from src.primitives.table import _formatHeaders
+from src.enums import Poppins
+from src.styles.fonts import register_fonts
+from src.types.components import TableData, EncodedColumn
+
+import pytest
+
+
+columns = {"a": "A", "status": "Status"}
+
+
+def data(count: int) -> dict[str, list[str]]:
+    # A long value far past the rows sampled for column widths
+    status = ["Ok"] * count
+    status[count - 1] = "Aguardando confirmação do pagamento"
+    return {"a": [str(i % 10) for i in range(count)], "status": status}
+
+
+def test_columns_encoded():
+    table_data = TableData.from_columns(columns, data(500))
+    table_data.startLayout()
+
+    column = table_data.data.columns["status"]
+    assert isinstance(column, EncodedColumn)
+    assert list(column.dictionary) == ["Ok", "Aguardando confirmação do pagamento"]
+
+    rows = [dict(table_data.rows.get(i)) for i in range(500)]
+    assert rows == [
+        {"a": a, "status": status} for a, status in zip(*data(500).values())
+    ]
+
+
+def test_encoded_columns_measured_whole():
+    source = data(500)
+    as_rows = [dict(zip(source, values)) for values in zip(*source.values())]
+
+    widths = []
+    for table_data in (
+        TableData(columns, as_rows),
+        TableData.from_columns(columns, source, encode=False),
+        TableData.from_columns(columns, source),
+    ):
+        table_data.startLayout()
+        widths.append(column_minimums(table_data, _formatHeaders(table_data.header)))
+
+    # Only the dictionary of the encoded column holds the last value
+    assert widths[0] == widths[1]
+    assert widths[2][0] == widths[0][0]
+    assert widths[2][1] > widths[0][1]
+
+
+def test_text_widths(monkeypatch):
+    register_fonts()
+    monkeypatch.setattr(metrics, "max_cached_widths", 8)
+
+    texts = ["Situação", "WWW", "", "iiiii", "Situação", "Ωmega"] * 4
+    for font_name in ("Helvetica", Poppins.Regular):
+        assert metrics.text_widths(texts, font_name, 9) == pytest.approx(
+            [stringWidth(text, font_name, 9) for text in texts]
+        )
+        assert len(metrics._widths) <= 8
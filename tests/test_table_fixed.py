@@ -0,0 +1,56 @@
+from src.types.components import TableData, EncodedColumn
+from src.types.components.table import ColumnarRows
+
+import re
+from math import ceil
+
+import pytest
+
+
+statuses = ["Realizada", "Cancelada", "Agendada"]
+
+
+def rows(count: int) -> list[dict[str, str]]:
+    return [{"a": "x%d" % i, "status": statuses[i % 3]} for i in range(count)]
+
+
+def table(data, row_mode="fixed", **kwargs) -> TableData:
+    return TableData({"a": "A", "status": "Status"}, data, row_mode=row_mode, **kwargs)
+
+
+@pytest.mark.parametrize("count", [1, 40, 1000])
+def test_page_count(page_texts, table_builder, count):
+    texts = page_texts(table_builder(table(rows(count))).build_bytes())
+    pages = [[int(i) for i in re.findall(r"\bx(\d+)\b", text)] for text in texts]
+
+    assert [index for page in pages for index in page] == list(range(count))
+    # Rows of a single height: every page after the first holds as many
+    first, per_page = len(pages[0]), max(len(page) for page in pages)
+    assert all(len(page) == per_page for page in pages[1:-1])
+    assert len(pages) == 1 + ceil((count - first) / per_page)
+
+
+@pytest.mark.parametrize("row_mode", ["fixed", "wrap"])
+def test_columnar_source_matches_list(page_texts, table_builder, row_mode):
+    source = rows(500)
+    columnar = ColumnarRows(
+        {
+            "a": [row["a"] for row in source],
+            "status": EncodedColumn.encode(row["status"] for row in source),
+        }
+    )
+
+    from_list = table_builder(table(source, row_mode))
+    from_columns = table_builder(table(columnar, row_mode))
+    assert page_texts(from_columns.build_bytes()) == page_texts(from_list.build_bytes())
+
+
+def test_markup_in_fixed_values(page_texts, table_builder):
+    table_data = table(
+        [{"a": "x0", "status": "S", "local": "Caf&eacute; &amp; <b>Bar</b>"}],
+        nested_fields={"local": "Local"},
+    )
+
+    text = page_texts(table_builder(table_data).build_bytes())[0]
+    assert "Café & Bar" in text
+    assert "&amp;" not in text and "<b>" not in text
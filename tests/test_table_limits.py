@@ -0,0 +1,59 @@
+from src.types.components import TableData
+
+import re
+
+import pytest
+
+
+limits = [{"max_rows": 100}, {"max_pages": 3}, {"max_bytes": 20000}]
+
+
+def rows(count: int):
+    # Rows of different heights, so pages hold different numbers of them
+    return ({"a": "x%d" % i, "b": "y " * (i % 40)} for i in range(count))
+
+
+def table(data, **limit) -> TableData:
+    return TableData({"a": "A", "b": "B"}, data, **limit)
+
+
+def summary(texts: list[str]) -> tuple[list[str], list[str], int]:
+    """Rows drawn, rows left out according to the summary row, and pages."""
+    text = "".join(texts)
+    return (
+        re.findall(r"\bx(\d+)\b", text),
+        re.findall(r"e mais ([\d.]+) registros", text),
+        len(texts),
+    )
+
+
+@pytest.mark.parametrize("limit", limits)
+def test_iterator_source_matches_list(page_texts, table_builder, limit):
+    from_list = table_builder(table(list(rows(1000)), **limit))
+    from_iterator = table_builder(table(rows(1000), **limit))
+
+    drawn, more_rows, pages = summary(page_texts(from_list.build_bytes()))
+    assert more_rows == [str(1000 - len(drawn))]
+    assert summary(page_texts(from_iterator.build_bytes())) == (
+        drawn,
+        more_rows,
+        pages,
+    )
+
+
+@pytest.mark.parametrize("limit", limits)
+def test_rebuild(page_texts, table_builder, limit):
+    builder = table_builder(table(list(rows(1000)), **limit))
+
+    first = page_texts(builder.build_bytes())
+    assert page_texts(builder.build_bytes()) == first
+
+
+@pytest.mark.parametrize("limit", limits)
+def test_count_label_streams(page_texts, table_builder, limit):
+    table_data = table(rows(100_000), count_label="Total de registros", **limit)
+
+    text = "".join(page_texts(table_builder(table_data).build_bytes()))
+    assert re.search(r"Total de registros:\s*100\.000", text)
+    # Only the rows of the last page were kept, the others just counted
+    assert len(table_data.rows.buffer) < 200
@@ -0,0 +1,13 @@
+from src.types.components import TableData
+
+
+def test_nested_fields_read_in_pairs(page_texts, table_builder):
+    table_data = TableData(
+        {"data": "Data"},
+        [{"data": "12/04/2024", "status": "Realizada", "usuario": "Ana"}] * 3,
+        nested_fields={"status": "Status", "usuario": "Usuário"},
+    )
+
+    text = page_texts(table_builder(table_data).build_bytes())[0]
+    assert text.count("Status: Realizada") == 3
+    assert text.count("Usuário: Ana") == 3
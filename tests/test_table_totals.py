@@ -0,0 +1,37 @@
+from src.types.components import TableData, Count, Sum
+
+import pytest
+
+
+def rows(count: int):
+    for i in range(count):
+        yield {
+            "data": "%02d/%02d/2024" % (i % 28 + 1, i * 12 // count + 1),
+            "valor": "%d,50" % (i % 100),
+        }
+
+
+def table(data) -> TableData:
+    return TableData(
+        {"data": "Data", "valor": "Valor"},
+        data,
+        aggregates={"Total de consultas": Count(), "Valor total": Sum("valor")},
+        group_by=lambda row: row["data"][3:],
+        subtotals={"Valor": Sum("valor")},
+    )
+
+
+def test_rebuild(page_texts, table_builder):
+    builder = table_builder(table(list(rows(480))))
+
+    first = page_texts(builder.build_bytes())
+    assert "01/2024: 40 registros; Valor: 800,00" in "".join(first)
+    assert page_texts(builder.build_bytes()) == first
+
+
+def test_rebuild_iterator(table_builder):
+    builder = table_builder(table(rows(480)))
+    builder.build_bytes()
+
+    with pytest.raises(RuntimeError):
+        builder.build_bytes()
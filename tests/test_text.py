@@ -0,0 +1,64 @@
+from src.primitives.text import Text, max_cached_texts, text_cache_info, text_extent
+from src.styles.stylesheet import CustomStyleSheet
+
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.platypus import Paragraph
+
+import io
+import random
+
+import pytest
+
+
+styles = CustomStyleSheet.shared()
+
+# Letters, spaces of all kinds and the characters a Paragraph treats specially
+alphabet = "aeiouçãéAZ019 .,-/:\t\n\xa0\xad\u2009\u200b"
+
+
+def texts(count: int) -> list[str]:
+    chooser = random.Random(21)
+    return [
+        "".join(chooser.choices(alphabet, k=chooser.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.parametrize("style", [styles.Body, styles.Body_Bold_Right])
+def test_laid_out_like_paragraph(style):
+    for text in texts(2000):
+        for width in (8, 40, 120):
+            paragraph = Paragraph(text, style)
+            paragraph.wrap(width, 1000)
+
+            flowable = Text(text, style)
+            assert flowable.wrap(width, 1000)[1] == paragraph.height, repr(text)
+            assert flowable._width_max == pytest.approx(paragraph._width_max)
+            assert text_extent(text, style, width) == pytest.approx(
+                paragraph._width_max
+            )
+
+
+def draw(make, texts: list[str]) -> bytes:
+    canvas = Canvas(io.BytesIO(), invariant=1)
+    for text in texts:
+        flowable = make(text, styles.Body)
+        flowable.wrapOn(canvas, 60, 1000)
+        flowable.drawOn(canvas, 10, 10)
+    return canvas.getpdfdata()
+
+
+def test_cached_texts_drawn_like_paragraphs():
+    markup = ["<b>Situação</b> do pedido &amp; entrega", "a<br/>b", "x\u200by"]
+    plain = ["Uma descrição longa que quebra em várias linhas", "Curta"]
+
+    before = text_cache_info()
+    # Paragraphs made from cached fragments are the same as parsed ones
+    assert draw(Text, markup * 3) == draw(Paragraph, markup * 3)
+    draw(Text, plain * 3)
+    after = text_cache_info()
+
+    # Repeated texts are parsed and broken into lines only once
+    assert after["fragments"].hits - before["fragments"].hits >= 2 * len(markup)
+    assert after["lines"].hits - before["lines"].hits >= 2 * len(plain)
+    assert after["fragments"].maxsize == after["lines"].maxsize == max_cached_texts